@@ -0,0 +1,170 @@
+"""
+Command-line entry point shared by the run_benchmark_*.py scripts.
+
+    python -m benchmarks.cli --dataset drop --samples 10 \
+        --baseline "GPT-5.1 (Regular)=openai/gpt-5.1" \
+        --models "GLM-4.7 (RLM)=z-ai/glm-4.7" openai/gpt-4o-mini
+
+Models are given as `model_id` or `Display Name=model_id`. Without --baseline/--models the
+defaults from BenchmarkConfig are used. `--preset NAME` loads a named configuration from
+benchmarks/presets.py (e.g. `--preset quick`); other flags override individual preset fields.
+
+Heavy imports (runner, openai, rlm) happen inside main() so `--help` and argument errors return
+immediately.
+"""
+
+import argparse
+import os
+import sys
+
+from benchmarks.presets import PRESETS
+
+
+def _parse_model(spec: str) -> tuple[str | None, str]:
+    """Split `Name=model_id` into (name, model_id); a bare `model_id` has no name."""
+    name, sep, model_id = spec.rpartition("=")
+    if not sep:
+        return None, spec
+    if not name or not model_id:
+        raise argparse.ArgumentTypeError(f"Invalid model spec '{spec}', expected Name=model_id")
+    return name, model_id
+
+
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return n
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run RLM vs regular LLM benchmarks")
+    parser.add_argument(
+        "--preset",
+        choices=sorted(PRESETS),
+        help="Named configuration from benchmarks/presets.py; other flags override it",
+    )
+    parser.add_argument(
+        "--dataset",
+        nargs="+",
+        default=["hotpotqa"],
+        help="Task(s) to run: hotpotqa, musique, drop, squad_v2, boolq (default: hotpotqa)",
+    )
+    parser.add_argument("--samples", type=int, default=10, help="Examples per task (default: 10)")
+    parser.add_argument(
+        "--shuffle",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Shuffle examples (HotpotQA)",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=_parse_model,
+        help="Regular (non-RLM) baseline model, as model_id or 'Name=model_id'",
+    )
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        type=_parse_model,
+        default=[],
+        help="RLM models, each as model_id or 'Name=model_id'",
+    )
+    parser.add_argument(
+        "--backend", default="openrouter", help="Backend for the models (default: openrouter)"
+    )
+    parser.add_argument(
+        "--concurrency-per-model",
+        type=_positive_int,
+        help="RLM worker processes per model; every model already runs concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--max-parallel-requests",
+        type=_positive_int,
+        help="In-flight direct (non-RLM) API calls across all baseline models (default: 20)",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=_positive_int,
+        help="Client-side requests-per-minute limit for each baseline model (default: none)",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=_positive_int,
+        help="Client-side tokens-per-minute limit for each baseline model (default: none)",
+    )
+    parser.add_argument(
+        "--cache",
+        dest="use_cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Reuse completions cached by earlier runs; cached results are left out of time "
+        "averages (default: off)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    # Preset values become defaults, so explicit flags still win
+    preset = parser.parse_known_args(argv)[0].preset
+    if preset:
+        parser.set_defaults(**PRESETS[preset])
+    args = parser.parse_args(argv)
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    if not os.getenv("OPENROUTER_API_KEY"):
+        print("Error: OPENROUTER_API_KEY not found in environment.")
+        print("Set it in .env file to run benchmarks.")
+        return 1
+
+    from benchmarks.config import BenchmarkConfig, ModelConfig
+    from benchmarks.runner import BenchmarkRunner
+
+    config = BenchmarkConfig(max_samples=args.samples, use_cache=args.use_cache)
+    if args.baseline or args.models:
+        config.models = []
+        if args.baseline:
+            name, model_id = args.baseline
+            name = name or model_id.rsplit("/", 1)[-1]
+            config.models.append(ModelConfig(name, model_id, args.backend, use_rlm=False))
+        for name, model_id in args.models:
+            name = name or f"{model_id.rsplit('/', 1)[-1]} (RLM)"
+            config.models.append(ModelConfig(name, model_id, args.backend, use_rlm=True))
+    if args.concurrency_per_model:
+        for m in config.models:
+            m.concurrency = args.concurrency_per_model
+    for m in config.models:
+        if not m.use_rlm:
+            m.rpm = args.rpm or m.rpm
+            m.tpm = args.tpm or m.tpm
+    if args.max_parallel_requests:
+        config.max_parallel_requests = args.max_parallel_requests
+
+    print("=" * 70)
+    print(f"RLM Benchmark: {', '.join(args.dataset)} ({args.samples} examples per task)")
+    print("=" * 70)
+    for m in config.models:
+        print(f"  {'[RLM]     ' if m.use_rlm else '[Baseline]'} {m.name} ({m.model_id})")
+    print("=" * 70 + "\n")
+
+    runner = BenchmarkRunner(config)
+    runner.load_tasks(args.dataset, shuffle=args.shuffle)
+    runner.run()
+
+    print("\n" + "=" * 70)
+    print("Benchmark complete!")
+    print(f"Results saved with run_id: {runner.run_id}")
+    print("\nTo view the detailed report, run:")
+    for task in runner.tasks:
+        results_file = os.path.join(
+            config.output_dir, f"{task.dataset_name}_results_{runner.run_id}.jsonl"
+        )
+        print(f"  python benchmarks/viewer.py --file {results_file}")
+    print("=" * 70)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,9 @@ class ModelConfig:
     model_id: str  # API model ID
     backend: str  # "openrouter" or "openai"
     use_rlm: bool  # True for RLM, False for regular LLM
+    concurrency: int = 1  # RLM worker processes for this model (raise if rate limits allow)
+    rpm: int | None = None  # Direct calls: requests per minute (None: unlimited)
+    tpm: int | None = None  # Direct calls: prompt + completion tokens per minute (None: unlimited)
 
 
 @dataclass
@@ -18,6 +21,9 @@ class BenchmarkConfig:
     # Run config
     max_samples: int = 10
     output_dir: str = "benchmarks/results"
+    max_parallel_requests: int = 20  # In-flight direct (non-RLM) API calls; tune per provider
+    use_cache: bool = False  # Reuse cached completions across runs (times are then not fresh)
+    save_usage: bool = True  # Write per-call token usage to the results (needed for cost reports)
 
     def __post_init__(self):
         if self.models is None:
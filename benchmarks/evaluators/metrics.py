@@ -22,9 +22,17 @@ def normalize_answer(s):
     return white_space_fix(remove_articles(remove_punc(lower(s))))
 
 
+def tokenize_answer(s):
+    """Normalize an answer and split it into tokens."""
+    return normalize_answer(s).split()
+
+
 def f1_score(prediction, ground_truth):
-    prediction_tokens = normalize_answer(prediction).split()
-    ground_truth_tokens = normalize_answer(ground_truth).split()
+    return f1_score_tokens(tokenize_answer(prediction), tokenize_answer(ground_truth))
+
+
+def f1_score_tokens(prediction_tokens, ground_truth_tokens):
+    """Token-level F1 over already tokenized answers (see tokenize_answer)."""
     common = Counter(prediction_tokens) & Counter(ground_truth_tokens)
     num_same = sum(common.values())
     if num_same == 0:
@@ -39,6 +47,21 @@ def exact_match_score(prediction, ground_truth):
     return normalize_answer(prediction) == normalize_answer(ground_truth)
 
 
+def em_and_f1(prediction, ground_truth):
+    """Exact match and F1 together, normalizing each string once."""
+    return em_and_f1_tokens(tokenize_answer(prediction), tokenize_answer(ground_truth))
+
+
+def em_and_f1_tokens(prediction_tokens, ground_truth_tokens):
+    """Exact match and F1 over already tokenized answers.
+
+    Normalized strings are equal exactly when their token lists are, since normalize_answer
+    ends by re-joining on single spaces.
+    """
+    em = prediction_tokens == ground_truth_tokens
+    return em, f1_score_tokens(prediction_tokens, ground_truth_tokens)
+
+
 def metric_max_over_ground_truths(metric_fn, prediction, ground_truths):
     scores_for_ground_truths = []
     for ground_truth in ground_truths:
@@ -0,0 +1,50 @@
+"""
+On-disk cache of completion results, keyed by everything that determines the answer.
+
+Reruns of the same config (crash-resume, metric changes, adding a model to a sweep) then only
+pay for calls they have not made before. Lives in the parent process only: workers never touch it.
+"""
+
+import hashlib
+import json
+import os
+import shelve
+
+
+class LLMCache:
+    def __init__(self, path: str, enabled: bool = True):
+        """A disabled cache opens nothing: every get misses and put is a no-op."""
+        self._db = None
+        if enabled:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._db = shelve.open(path)
+
+    @staticmethod
+    def make_key(call_config: dict, *inputs: str) -> str:
+        """Content-addressed key over the effective call config and the per-example inputs.
+
+        `call_config` must hold every setting that can change the answer (mode, backend, model,
+        endpoint, prompts, sampling and iteration limits), so changing any of them is a miss.
+        """
+        raw = "\0".join([json.dumps(call_config, sort_keys=True), *inputs])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        """Return a cached result marked with `cached: True`, or None on a miss."""
+        if self._db is None:
+            return None
+        result = self._db.get(key)
+        if result is None:
+            return None
+        return {**result, "cached": True}
+
+    def put(self, key: str, result: dict):
+        """Store a result. Failed calls are not cached so they are retried on the next run."""
+        if self._db is None or "error" in result:
+            return
+        self._db[key] = result
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
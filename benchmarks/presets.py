@@ -0,0 +1,65 @@
+"""
+Named benchmark configurations, selected with `python -m benchmarks.cli --preset NAME`.
+
+Each run_benchmark_<name>.py script is a shim for the preset of the same name. Values are in
+parsed CLI form (the (name, model_id) pairs that --baseline/--models produce), so any flag given
+alongside --preset overrides just that field.
+"""
+
+# Rosters shared by several presets
+_GPT_51 = ("GPT-5.1", "openai/gpt-5.1")
+_GPT_51_REGULAR = ("GPT-5.1 (Regular)", "openai/gpt-5.1")
+_GPT_4O_MINI = ("GPT-4o-mini (RLM)", "openai/gpt-4o-mini")
+_MIMO = ("Xiaomi Mimo v2 Flash (RLM)", "xiaomi/mimo-v2-flash")
+_GLM = ("Z-AI GLM-4.7 (RLM)", "z-ai/glm-4.7")
+_MINIMAX = ("MiniMax M2.1 (RLM)", "minimax/minimax-m2.1")
+_GLM_SHORT = ("GLM-4.7 (RLM)", "z-ai/glm-4.7")
+_MINIMAX_SHORT = ("MiniMax-M2.1 (RLM)", "minimax/minimax-m2.1")
+
+PRESETS: dict[str, dict] = {
+    "quick": {
+        "samples": 5,
+        "baseline": ("GPT-4o (Regular)", "openai/gpt-4o"),
+        "models": [_GPT_4O_MINI],
+    },
+    "5": {
+        "samples": 5,
+        "shuffle": True,
+        "baseline": _GPT_51,
+        "models": [_GPT_4O_MINI, _GLM, _MINIMAX],
+    },
+    "20": {
+        "samples": 20,
+        "shuffle": True,
+        "baseline": _GPT_51,
+        "models": [_GPT_4O_MINI, _MIMO, _GLM, _MINIMAX],
+    },
+    "final": {
+        "samples": 10,
+        "shuffle": True,
+        "baseline": _GPT_51,
+        "models": [_GPT_4O_MINI, _MIMO, _GLM, _MINIMAX],
+    },
+    "custom": {
+        "samples": 10,
+        "baseline": _GPT_51_REGULAR,
+        "models": [
+            ("MiMo-v2-Flash (RLM)", "xiaomi/mimo-v2-flash"),
+            _GLM_SHORT,
+            _MINIMAX_SHORT,
+            _GPT_4O_MINI,
+        ],
+    },
+    "drop": {
+        "dataset": ["drop"],
+        "samples": 10,
+        "baseline": _GPT_51_REGULAR,
+        "models": [_GLM_SHORT, _MINIMAX_SHORT, _GPT_4O_MINI],
+    },
+    "hotpotqa_20": {
+        "samples": 20,
+        "shuffle": True,
+        "baseline": _GPT_51_REGULAR,
+        "models": [_GLM_SHORT, _MINIMAX_SHORT, _GPT_4O_MINI],
+    },
+}
@@ -6,6 +6,8 @@ Source: https://openrouter.ai/models (as of Jan 2025)
 Prices may need to be updated if OpenRouter changes pricing.
 """
 
+from functools import cache
+
 # Pricing: (input_price_per_million, output_price_per_million)
 # Source: https://openrouter.ai/models (as of Jan 2025)
 PRICING = {
@@ -28,11 +30,14 @@ def get_pricing(model_id: str) -> tuple[float, float]:
     return PRICING.get(model_id, DEFAULT_PRICING)
 
 
-def calculate_cost(input_tokens: int, output_tokens: int, model_id: str) -> float:
-    """Calculate cost in USD for given token usage."""
+@cache
+def _get_per_token_pricing(model_id: str) -> tuple[float, float]:
+    """Per-token (input, output) prices, computed once per model."""
     input_price, output_price = get_pricing(model_id)
+    return input_price / 1_000_000, output_price / 1_000_000
 
-    input_cost = (input_tokens / 1_000_000) * input_price
-    output_cost = (output_tokens / 1_000_000) * output_price
 
-    return input_cost + output_cost
+def calculate_cost(input_tokens: int, output_tokens: int, model_id: str) -> float:
+    """Calculate cost in USD for given token usage."""
+    input_price, output_price = _get_per_token_pricing(model_id)
+    return input_tokens * input_price + output_tokens * output_price
@@ -0,0 +1,64 @@
+"""
+Client-side rate limiting for direct API calls.
+
+Waiting locally for budget is cheaper than sending a request the provider will 429: a rejected
+call costs a round-trip plus the SDK's exponential backoff, during which its semaphore slot idles.
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async limiter for requests per minute and, optionally, tokens per minute.
+
+    Requests are admitted in FIFO order. Token usage is only known once a response arrives, so it
+    is charged afterwards via record_tokens(); the bucket may go into debt, and later requests wait
+    until it has refilled.
+    """
+
+    def __init__(self, rpm: int | None = None, tpm: int | None = None):
+        for name, value in (("rpm", rpm), ("tpm", tpm)):
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be >= 1, got {value}")
+        self.rpm = rpm
+        self.tpm = tpm
+        # Start full so the first minute's budget is usable immediately
+        self._requests = float(rpm or 0)
+        self._tokens = float(tpm or 0)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def _wait_time(self) -> float:
+        """Seconds until one more request fits, or 0 if it fits now."""
+        wait = 0.0
+        if self.rpm and self._requests < 1:
+            wait = (1 - self._requests) * 60 / self.rpm
+        if self.tpm and self._tokens < 0:
+            wait = max(wait, -self._tokens * 60 / self.tpm)
+        return wait
+
+    async def acquire(self):
+        """Wait until a request may be sent, then take one request from the bucket."""
+        async with self._lock:
+            self._refill()
+            while (wait := self._wait_time()) > 0:
+                await asyncio.sleep(wait)
+                self._refill()
+            if self.rpm:
+                self._requests -= 1
+
+    def record_tokens(self, tokens: int):
+        """Charge the tokens a finished request used against the tokens-per-minute budget."""
+        if self.tpm:
+            self._refill()
+            self._tokens -= tokens
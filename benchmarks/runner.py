@@ -1,97 +1,168 @@
 """
 Benchmark runner with optimized execution strategy:
-- Non-RLM models: Parallel execution via threads (thread-safe HTTP calls)
+- Non-RLM models: Concurrent execution via asyncio (one AsyncOpenAI client, bounded by a semaphore)
 - RLM models: Parallel execution via multiprocessing (isolated process pools per model)
   Each RLM model runs in its own process pool, allowing multiple models to execute concurrently.
+- Per task, all (example, model) pairs of both kinds are gathered in a single event loop.
+  RLM completions cannot share a process: LocalREPL swaps sys.stdout/sys.stderr and changes the
+  working directory on every code execution, so threads (or an event loop) would interleave them.
 """
 
+import asyncio
+import importlib
 import json
+import multiprocessing
 import os
 import sys
 import time
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
+import httpx
 import openai
-from tqdm import tqdm
+from tqdm.asyncio import tqdm as atqdm
 
 from rlm import RLM
+from rlm.core.types import UsageSummary
+from rlm.utils.prompts import RLM_SYSTEM_PROMPT
 
 from .config import BenchmarkConfig, ModelConfig
-from .evaluators.metrics import exact_match_score, f1_score
+from .evaluators.metrics import em_and_f1_tokens, tokenize_answer
+from .llm_cache import LLMCache
+from .rate_limiter import TokenBucket
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Direct calls are greedy so their cached results are reproducible
+DIRECT_TEMPERATURE = 0.0
+# Prompt for direct (non-RLM) calls: % (context, question)
+DIRECT_PROMPT_TEMPLATE = (
+    "Context:\n%s\n\nQuestion: %s\n\nAnswer the question based on the context. Be concise."
+)
+# Settings of every RLM worker completion
+RLM_ENVIRONMENT = "local"
+RLM_MAX_ITERATIONS = 30
+
+
+def _dumps_line(obj) -> bytes:
+    """Encode one JSONL line, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + "\n").encode()
+
+
+def _total_tokens(usage: dict) -> int:
+    """Input plus output tokens in a serialized usage summary."""
+    return sum(
+        m["total_input_tokens"] + m["total_output_tokens"]
+        for m in usage.get("model_usage_summaries", {}).values()
+    )
+
+
+def _count_llm_calls(usage_summary: UsageSummary) -> int:
+    """Total LM calls in a usage summary; most RLM runs use a single model."""
+    summaries = usage_summary.model_usage_summaries
+    if len(summaries) == 1:
+        return next(iter(summaries.values())).total_calls
+    return sum(m.total_calls for m in summaries.values())
+
+
+# Backends served by rlm's OpenAIClient, which accepts a shared `http_client`
+_OPENAI_SDK_BACKENDS = ("openai", "openrouter", "vllm")
 
 # Global variables for multiprocessing workers (initialized per process)
 _rlm_worker_client = None
 _rlm_worker_config = None
 
 
-def _init_rlm_worker(model_config_dict: dict):
-    """Initialize RLM client in worker process. Must be top-level for pickling."""
-    global _rlm_worker_client, _rlm_worker_config
+def _init_rlm_worker(model_config_dict: dict, api_key: str | None, base_url: str | None):
+    """Initialize RLM client in worker process. Must be top-level for pickling.
 
-    api_key = os.getenv("OPENAI_API_KEY") or os.getenv("OPENROUTER_API_KEY")
-    base_url = "https://openrouter.ai/api/v1" if os.getenv("OPENROUTER_API_KEY") else None
+    Credentials are resolved once in the parent and passed in, so workers do not depend on
+    the environment they were started with. The worker's HTTP client is built here, after the
+    fork, and shared by every completion so connections to the provider stay warm.
+    """
+    global _rlm_worker_client, _rlm_worker_config
 
     _rlm_worker_config = model_config_dict
+    backend_kwargs = {
+        "model_name": model_config_dict["model_id"],
+        "api_key": api_key,
+        "base_url": base_url,
+    }
+    if model_config_dict["backend"] in _OPENAI_SDK_BACKENDS:
+        backend_kwargs["http_client"] = openai.DefaultHttpxClient(
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300)
+        )
     _rlm_worker_client = RLM(
         backend=model_config_dict["backend"],
-        backend_kwargs={
-            "model_name": model_config_dict["model_id"],
-            "api_key": api_key,
-            "base_url": base_url,
-        },
-        environment="local",
+        backend_kwargs=backend_kwargs,
+        environment=RLM_ENVIRONMENT,
+        max_iterations=RLM_MAX_ITERATIONS,
         verbose=False,
     )
 
 
-def _run_rlm_task_in_process(task_data: dict) -> dict:
-    """Execute single RLM call in worker process. Must be top-level for pickling."""
-    global _rlm_worker_client
+def _rlm_mp_context():
+    """Start method for RLM worker pools.
+
+    On Linux, use forkserver with rlm/openai preloaded: workers fork from a warm, single-threaded
+    server instead of from the parent, which by then runs asyncio, httpx and tqdm threads.
+    Elsewhere keep the platform default (spawn).
+    """
+    if sys.platform != "linux":
+        return None
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["rlm", "openai"])
+    return ctx
+
 
-    question = task_data["question"]
-    context = task_data["context"]
-    model_id = task_data["model_id"]
+def _run_rlm_task_in_process(question: str, context: str) -> dict:
+    """Execute single RLM call in worker process. Must be top-level for pickling.
 
+    Only the example-specific fields are sent per task; the model comes from the worker's config.
+    """
+    global _rlm_worker_client
+
+    model_id = _rlm_worker_config["model_id"]
     start_time = time.time()
 
     try:
         result = _rlm_worker_client.completion(prompt=context, root_prompt=question)
-        usage = result.usage_summary.to_dict()
-        total_calls = sum(m["total_calls"] for m in usage.get("model_usage_summaries", {}).values())
+        total_calls = _count_llm_calls(result.usage_summary)
 
         return {
-            "answer": result.response,
+            "answer": result.response if isinstance(result.response, str) else str(result.response),
             "time": time.time() - start_time,
             "model": model_id,
             "llm_calls": total_calls,
-            "usage": usage,
+            "usage": result.usage_summary.to_dict(),
         }
     except Exception as e:
         return {"answer": f"Error: {e}", "time": 0, "error": str(e), "llm_calls": 0}
 
 
 # Task Registry: Add new datasets here
-def _load_task_registry():
-    """Registry of available tasks. Lazy imports to avoid circular dependencies."""
-    from .tasks.boolq import BoolQTask
-    from .tasks.drop import DROPTask
-    from .tasks.hotpotqa import HotpotQATask
-    from .tasks.musique import MusiqueTask
-    from .tasks.squad_v2 import SQuADv2Task
-
-    return {
-        "hotpotqa": lambda config, shuffle: HotpotQATask(
-            max_samples=config.max_samples, shuffle=shuffle
-        ),
-        "musique": lambda config, shuffle: MusiqueTask(max_samples=config.max_samples),
-        "drop": lambda config, shuffle: DROPTask(max_samples=config.max_samples),
-        "squad_v2": lambda config, shuffle: SQuADv2Task(
-            max_samples=config.max_samples, answerable_only=True
-        ),
-        "boolq": lambda config, shuffle: BoolQTask(max_samples=config.max_samples),
-    }
+# name -> (module, class, extra constructor kwargs). Modules are imported by load_tasks only for
+# the requested tasks, so unused datasets (and their dependencies) are never imported.
+_TASK_REGISTRY = {
+    "hotpotqa": (".tasks.hotpotqa", "HotpotQATask", {}),
+    "musique": (".tasks.musique", "MusiqueTask", {}),
+    "drop": (".tasks.drop", "DROPTask", {}),
+    "squad_v2": (".tasks.squad_v2", "SQuADv2Task", {"answerable_only": True}),
+    "boolq": (".tasks.boolq", "BoolQTask", {}),
+}
+# Tasks whose constructor accepts `shuffle`
+_SHUFFLE_TASKS = {"hotpotqa"}
 
 
 class BenchmarkRunner:
@@ -99,49 +170,125 @@ class BenchmarkRunner:
         self.config = config
         self.tasks = []
         self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self._task_registry = _load_task_registry()
+        self._output_template = os.path.join(
+            config.output_dir, "{task_name}_results_" + self.run_id + ".jsonl"
+        )
+        self._rlm_executors: dict[str, ProcessPoolExecutor] = {}
+        # Opened by each run_async() and closed when it ends
+        self._cache = LLMCache("", enabled=False)
+        # Per-model limiters for direct calls; shared by all tasks so budgets carry over
+        self._rate_limiters = {
+            m.name: TokenBucket(m.rpm, m.tpm)
+            for m in config.models
+            if not m.use_rlm and (m.rpm or m.tpm)
+        }
 
         # Cache API credentials
         self._api_key = os.getenv("OPENAI_API_KEY") or os.getenv("OPENROUTER_API_KEY")
         self._base_url = "https://openrouter.ai/api/v1" if os.getenv("OPENROUTER_API_KEY") else None
 
     def _create_openai_client(self):
-        """Create a regular OpenAI client (thread-safe)."""
-        return openai.OpenAI(api_key=self._api_key, base_url=self._base_url)
-
-    def _create_rlm_client(self, model_config: ModelConfig):
-        """Create an RLM client (NOT thread-safe, use one per model sequentially)."""
-        return RLM(
-            backend=model_config.backend,
-            backend_kwargs={
-                "model_name": model_config.model_id,
-                "api_key": self._api_key,
-                "base_url": self._base_url,
-            },
-            environment="local",
-            verbose=False,
+        """Create an async OpenAI client. Must be created inside the event loop that uses it.
+
+        The connection pool is sized to the fan-out so concurrent calls reuse warm keep-alive
+        connections instead of re-handshaking.
+        """
+        pool_size = max(64, self.config.max_parallel_requests)
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            timeout=httpx.Timeout(60.0, connect=10.0),
         )
+        return openai.AsyncOpenAI(
+            api_key=self._api_key, base_url=self._base_url, http_client=http_client
+        )
+
+    def _call_config(self, model_config: ModelConfig) -> dict:
+        """Every setting besides the example that determines a model's answer, for cache keys."""
+        call_config = {
+            "backend": model_config.backend,
+            "model_id": model_config.model_id,
+            "base_url": self._base_url,
+        }
+        if model_config.use_rlm:
+            return {
+                **call_config,
+                "mode": "rlm",
+                "environment": RLM_ENVIRONMENT,
+                "max_iterations": RLM_MAX_ITERATIONS,
+                "system_prompt": RLM_SYSTEM_PROMPT,
+            }
+        # Direct keys also hash the rendered prompt, which covers DIRECT_PROMPT_TEMPLATE
+        return {**call_config, "mode": "direct", "temperature": DIRECT_TEMPERATURE}
+
+    def _get_rlm_executor(self, model_config: ModelConfig) -> ProcessPoolExecutor:
+        """Get the process pool for an RLM model, creating it on first use.
+
+        Pools are reused across tasks so worker startup (fork, RLM import, client setup)
+        is paid once per model per run. Processes, not threads: see module docstring.
+        """
+        if model_config.name not in self._rlm_executors:
+            # Convert ModelConfig to dict for pickling
+            model_config_dict = {
+                "name": model_config.name,
+                "model_id": model_config.model_id,
+                "backend": model_config.backend,
+            }
+            # One worker per model by default to avoid rate limiting (as tested); examples are
+            # sharded across `concurrency` workers when the provider allows more
+            self._rlm_executors[model_config.name] = ProcessPoolExecutor(
+                max_workers=model_config.concurrency,
+                mp_context=_rlm_mp_context(),
+                initializer=_init_rlm_worker,
+                initargs=(model_config_dict, self._api_key, self._base_url),
+                # Never recycle workers: each keeps its RLM client and HTTP pool for the run
+                max_tasks_per_child=None,
+            )
+        return self._rlm_executors[model_config.name]
+
+    def close(self):
+        """Shut down the RLM process pools and flush the result cache."""
+        for executor in self._rlm_executors.values():
+            executor.shutdown(wait=True)
+        self._rlm_executors.clear()
+        self._cache.close()
 
     def load_tasks(self, task_names: list[str], shuffle: bool = False):
-        """Load tasks by name from registry."""
+        """Load tasks by name from registry, fetching their datasets in parallel."""
+        unknown = [name for name in task_names if name not in _TASK_REGISTRY]
+        if unknown:
+            available = ", ".join(_TASK_REGISTRY.keys())
+            raise ValueError(f"Unknown task(s): {', '.join(unknown)}. Available: {available}")
+
+        new_tasks = []
         for name in task_names:
-            if name in self._task_registry:
-                self.tasks.append(self._task_registry[name](self.config, shuffle))
-            else:
-                available = ", ".join(self._task_registry.keys())
-                print(f"Unknown task '{name}'. Available: {available}")
-
-    def _run_openai_call(
-        self, client, model_id: str, question: str, context: str
-    ) -> dict[str, Any]:
-        """Execute a single OpenAI API call (thread-safe)."""
+            module_name, class_name, kwargs = _TASK_REGISTRY[name]
+            task_cls = getattr(importlib.import_module(module_name, __package__), class_name)
+            if name in _SHUFFLE_TASKS:
+                kwargs = {**kwargs, "shuffle": shuffle}
+            new_tasks.append(task_cls(max_samples=self.config.max_samples, **kwargs))
+
+        # Dataset loading is download/disk bound, so overlap it across tasks up front. Each task's
+        # progress lines are held and printed here in task order, so threads never interleave them.
+        if new_tasks:
+            print(f"Loading datasets: {', '.join(task_names)}...")
+            for task in new_tasks:
+                task.hold_output()
+            try:
+                with ThreadPoolExecutor(max_workers=len(new_tasks)) as executor:
+                    list(executor.map(lambda task: task.get_examples(), new_tasks))
+            finally:
+                for task in new_tasks:
+                    task.release_output()
+        self.tasks.extend(new_tasks)
+
+    async def _run_openai_call(self, client, model_id: str, prompt: str) -> dict[str, Any]:
+        """Execute a single OpenAI API call on an already formatted prompt."""
         start_time = time.time()
         try:
-            prompt = f"Context:\n{context}\n\nQuestion: {question}\n\nAnswer the question based on the context. Be concise."
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model=model_id,
                 messages=[{"role": "user", "content": prompt}],
-                temperature=0.0,
+                temperature=DIRECT_TEMPERATURE,
             )
 
             # Extract usage data if available
@@ -158,7 +305,8 @@ class BenchmarkRunner:
                 }
 
             return {
-                "answer": response.choices[0].message.content,
+                # content is None when the model returns no text; score that as an empty answer
+                "answer": response.choices[0].message.content or "",
                 "time": time.time() - start_time,
                 "model": model_id,
                 "llm_calls": 1,
@@ -167,207 +315,190 @@ class BenchmarkRunner:
         except Exception as e:
             return {"answer": f"Error: {e}", "time": 0, "error": str(e), "llm_calls": 0}
 
-    def _run_rlm_call(self, client, model_id: str, question: str, context: str) -> dict[str, Any]:
-        """Execute a single RLM call (NOT thread-safe)."""
-        start_time = time.time()
-        try:
-            result = client.completion(prompt=context, root_prompt=question)
-            usage = result.usage_summary.to_dict()
-            total_calls = sum(
-                m["total_calls"] for m in usage.get("model_usage_summaries", {}).values()
-            )
-            return {
-                "answer": result.response,
-                "time": time.time() - start_time,
-                "model": model_id,
-                "llm_calls": total_calls,
-                "usage": usage,
-            }
-        except Exception as e:
-            return {"answer": f"Error: {e}", "time": 0, "error": str(e), "llm_calls": 0}
+    async def _run_task_models(self, examples: list, f_out) -> dict:
+        """Run all models on all examples of one task, gathering every (example, model) pair in
+        one event loop so direct and RLM calls overlap.
 
-    def _run_non_rlm_models_parallel(self, examples: list) -> dict:
-        """Run all non-RLM models on all examples in parallel."""
+        Direct calls share one async client, at most `max_parallel_requests` in flight. RLM calls
+        are submitted to their model's process pool and awaited through asyncio.wrap_future.
+        Each example is scored and written to `f_out` as soon as its last model finishes.
+        Returns per-model running totals for the summary.
+        """
         non_rlm_models = [m for m in self.config.models if not m.use_rlm]
-        if not non_rlm_models:
-            return {}
-
-        results = {}
-        client = self._create_openai_client()
-        total_tasks = len(examples) * len(non_rlm_models)
-
-        print(
-            f"  Running {len(non_rlm_models)} non-RLM model(s) on {len(examples)} examples in parallel..."
-        )
-        sys.stdout.flush()
-
-        with ThreadPoolExecutor(max_workers=min(total_tasks, 20)) as executor:
-            future_to_key = {
-                executor.submit(
-                    self._run_openai_call,
-                    client,
-                    model_config.model_id,
-                    example.question,
-                    example.context,
-                ): (example.id, model_config.name)
-                for example in examples
-                for model_config in non_rlm_models
-            }
-
-            for future in tqdm(
-                as_completed(future_to_key),
-                total=len(future_to_key),
-                desc="  Non-RLM",
-                leave=False,
-            ):
-                key = future_to_key[future]
-                try:
-                    results[key] = future.result()
-                except Exception as e:
-                    results[key] = {
-                        "answer": f"Error: {e}",
-                        "time": 0,
-                        "error": str(e),
-                        "llm_calls": 0,
-                    }
-
-        return results
-
-    def _run_rlm_models_parallel(self, examples: list) -> dict:
-        """Run all RLM models in parallel using separate process pools per model."""
         rlm_models = [m for m in self.config.models if m.use_rlm]
-        if not rlm_models:
-            return {}
-
-        results = {}
 
         print(
-            f"  Running {len(rlm_models)} RLM model(s) on {len(examples)} examples in parallel (process pools)..."
+            f"  Running {len(self.config.models)} model(s) on {len(examples)} examples in parallel "
+            f"({len(non_rlm_models)} direct, {len(rlm_models)} RLM in process pools)..."
         )
         sys.stdout.flush()
 
-        # Create a ProcessPoolExecutor for each RLM model
-        # Each executor uses 1 worker to avoid rate limiting (as tested)
-        executors = {}
-        all_futures = {}
-
-        for model_config in rlm_models:
-            # Convert ModelConfig to dict for pickling
-            model_config_dict = {
-                "name": model_config.name,
-                "model_id": model_config.model_id,
-                "backend": model_config.backend,
-            }
-
-            executor = ProcessPoolExecutor(
-                max_workers=1,
-                initializer=_init_rlm_worker,
-                initargs=(model_config_dict,),
+        num_models = len(self.config.models)
+        pending = {example.id: {} for example in examples}
+        totals = {
+            "count": 0,
+            "models": {
+                m.name: {"f1": 0.0, "time": 0.0, "llm_calls": 0, "cached": 0}
+                for m in self.config.models
+            },
+        }
+        semaphore = asyncio.Semaphore(self.config.max_parallel_requests)
+        # Format each example's direct prompt once, shared by every direct model
+        prompts = {
+            example.id: DIRECT_PROMPT_TEMPLATE % (example.context, example.question)
+            for example in examples
+            if non_rlm_models
+        }
+        call_configs = {m.name: self._call_config(m) for m in self.config.models}
+
+        def _record(example, model_name: str, result: dict) -> None:
+            """Collect one model's result; write the example once every model has returned."""
+            model_results = pending[example.id]
+            model_results[model_name] = result
+            if len(model_results) < num_models:
+                return
+            del pending[example.id]
+            result_entry = self._assemble_entry(example, model_results)
+            f_out.write(_dumps_line(result_entry))
+            f_out.flush()
+            totals["count"] += 1
+            for name, scored in result_entry["models"].items():
+                model_totals = totals["models"][name]
+                model_totals["f1"] += scored["f1"]
+                model_totals["llm_calls"] += scored["llm_calls"]
+                # A cached result carries the original call's time; keep it out of the average
+                if scored.get("cached"):
+                    model_totals["cached"] += 1
+                else:
+                    model_totals["time"] += scored["time"]
+
+        async def _direct(client, model_config: ModelConfig, example) -> None:
+            cache_key = LLMCache.make_key(call_configs[model_config.name], prompts[example.id])
+            result = self._cache.get(cache_key)
+            if result is None:
+                limiter = self._rate_limiters.get(model_config.name)
+                # Wait for rate budget before taking a semaphore slot other models could use
+                if limiter is not None:
+                    await limiter.acquire()
+                async with semaphore:
+                    result = await self._run_openai_call(
+                        client, model_config.model_id, prompts[example.id]
+                    )
+                if limiter is not None:
+                    limiter.record_tokens(_total_tokens(result.get("usage", {})))
+                self._cache.put(cache_key, result)
+            _record(example, model_config.name, result)
+
+        async def _rlm(model_config: ModelConfig, example) -> None:
+            cache_key = LLMCache.make_key(
+                call_configs[model_config.name], example.question, example.context
             )
-            executors[model_config.name] = executor
-
-            # Submit all examples for this model
-            for example in examples:
-                task_data = {
-                    "example_id": example.id,
-                    "question": example.question,
-                    "context": example.context,
-                    "model_id": model_config.model_id,
+            result = self._cache.get(cache_key)
+            if result is not None:
+                _record(example, model_config.name, result)
+                return
+            # The context is pickled once per (example, RLM model), i.e. once per worker pipe.
+            # Preloading contexts via initargs would ship the same bytes and tie the pool to a task.
+            future = self._get_rlm_executor(model_config).submit(
+                _run_rlm_task_in_process, example.question, example.context
+            )
+            try:
+                result = await asyncio.wrap_future(future)
+            except Exception as e:
+                result = {
+                    "answer": f"Error: {e}",
+                    "time": 0,
+                    "error": str(e),
+                    "llm_calls": 0,
                 }
-                future = executor.submit(_run_rlm_task_in_process, task_data)
-                all_futures[future] = (example.id, model_config.name)
+            self._cache.put(cache_key, result)
+            _record(example, model_config.name, result)
 
-        # Collect results from all executors as they complete
+        client = self._create_openai_client() if non_rlm_models else None
         try:
-            for future in tqdm(
-                as_completed(all_futures),
-                total=len(all_futures),
-                desc="  RLM",
+            coros = [
+                _direct(client, model_config, example)
+                for example in examples
+                for model_config in non_rlm_models
+            ]
+            coros += [
+                _rlm(model_config, example) for example in examples for model_config in rlm_models
+            ]
+            # Throttle repaints: completions can arrive in bursts of hundreds
+            for coro in atqdm.as_completed(
+                coros,
+                total=len(coros),
+                desc="  Models",
                 leave=False,
+                mininterval=1.0,
+                miniters=max(1, len(coros) // 200),
+                smoothing=0,
             ):
-                key = all_futures[future]
-                try:
-                    results[key] = future.result()
-                except Exception as e:
-                    results[key] = {
-                        "answer": f"Error: {e}",
-                        "time": 0,
-                        "error": str(e),
-                        "llm_calls": 0,
-                    }
+                await coro
         finally:
-            # Shutdown all executors
-            for executor in executors.values():
-                executor.shutdown(wait=True)
-
-        return results
-
-    def _assemble_results(self, examples: list, all_results: dict) -> list[dict]:
-        """Assemble per-example results."""
-        results = []
-
-        for example in examples:
-            result_entry = {
-                "id": example.id,
-                "question": example.question,
-                "gold_answer": example.gold_answer,
-                "models": {},
-            }
-
-            for model_config in self.config.models:
-                key = (example.id, model_config.name)
-                if key not in all_results:
-                    print(f"Warning: Missing result for {key}")
-                    continue
-
-                model_result = all_results[key]
-                if not isinstance(model_result["answer"], str):
-                    model_result["answer"] = str(model_result["answer"])
-
-                em = exact_match_score(model_result["answer"], example.gold_answer)
-                f1 = f1_score(model_result["answer"], example.gold_answer)
-
-                result_entry["models"][model_config.name] = {**model_result, "em": em, "f1": f1}
-
-            results.append(result_entry)
-
-        return results
-
-    def _save_results(self, results: list[dict], task_name: str) -> str:
-        """Save results to JSONL file."""
-        output_file = os.path.join(
-            self.config.output_dir, f"{task_name}_results_{self.run_id}.jsonl"
-        )
+            if client is not None:
+                await client.close()
+
+        return totals
+
+    def _assemble_entry(self, example, model_results: dict) -> dict:
+        """Score every model's answer for one example and build its JSONL entry."""
+        result_entry = {
+            "id": example.id,
+            "question": example.question,
+            "gold_answer": example.gold_answer,
+            "models": {},
+        }
+        # Tokenize the gold answer once, not once per model
+        gold_tokens = tokenize_answer(example.gold_answer)
 
-        with open(output_file, "w") as f:
-            for res in results:
-                f.write(json.dumps(res) + "\n")
+        for model_config in self.config.models:
+            # Answers are coerced to str where they are produced (worker / direct call)
+            model_result = model_results[model_config.name]
+            model_result["em"], model_result["f1"] = em_and_f1_tokens(
+                tokenize_answer(model_result["answer"]), gold_tokens
+            )
+            if not self.config.save_usage:
+                # Results (and the cache) keep usage; only the JSONL output drops it
+                model_result.pop("usage", None)
+            result_entry["models"][model_config.name] = model_result
 
-        print(f"✓ Saved {len(results)} results to {output_file}")
-        return output_file
+        return result_entry
 
-    def _print_summary(self, results: list[dict], task_name: str, output_file: str):
-        """Print benchmark summary statistics."""
+    def _print_summary(self, totals: dict, task_name: str, output_file: str):
+        """Print benchmark summary statistics from the running per-model totals."""
+        count = totals["count"]
         print(f"\n{'=' * 70}")
         print(f"Results Summary for {task_name}:")
         print(f"{'=' * 70}")
 
         for model_config in self.config.models:
             mode = "RLM" if model_config.use_rlm else "Direct"
-            avg_f1 = sum(r["models"][model_config.name]["f1"] for r in results) / len(results)
-            avg_time = sum(r["models"][model_config.name]["time"] for r in results) / len(results)
-            avg_calls = sum(r["models"][model_config.name]["llm_calls"] for r in results) / len(
-                results
-            )
+            model_totals = totals["models"][model_config.name]
+            avg_f1 = model_totals["f1"] / count
+            fresh = count - model_totals["cached"]
+            avg_time = f"{model_totals['time'] / fresh:>5.1f}s" if fresh else "   n/a"
+            avg_calls = model_totals["llm_calls"] / count
             print(
-                f"{model_config.name:<30} ({mode:>6}) | F1: {avg_f1:.3f} | Time: {avg_time:>5.1f}s | Calls: {avg_calls:.1f}"
+                f"{model_config.name:<30} ({mode:>6}) | F1: {avg_f1:.3f} | Time: {avg_time} | Calls: {avg_calls:.1f} | Cached: {model_totals['cached']}/{count}"
             )
 
         print(f"{'=' * 70}")
         print(f"Details: {output_file}")
 
     def run(self):
-        """Run all loaded tasks with optimized execution strategy."""
+        """Run all loaded tasks with optimized execution strategy (on uvloop when installed)."""
+        if uvloop is not None:
+            uvloop.run(self.run_async())
+        else:
+            asyncio.run(self.run_async())
+
+    async def run_async(self):
+        """Coroutine form of run() for callers that already own an event loop.
+
+        All tasks share this one loop; within a task every (example, model) pair is in flight
+        at once, bounded by `max_parallel_requests` for direct calls and the RLM pool sizes.
+        """
         os.makedirs(self.config.output_dir, exist_ok=True)
 
         # Separate models by type
@@ -377,7 +508,7 @@ class BenchmarkRunner:
         print("=" * 70)
         print("BENCHMARK CONFIGURATION")
         print("=" * 70)
-        print(f"Non-RLM models (parallel threads): {len(non_rlm)}")
+        print(f"Non-RLM models (async requests):   {len(non_rlm)}")
         for m in non_rlm:
             print(f"  - {m.name}")
         print(f"RLM models (parallel processes):   {len(rlm)}")
@@ -386,28 +517,27 @@ class BenchmarkRunner:
         print("=" * 70)
         sys.stdout.flush()
 
-        # Run each task
-        for task in self.tasks:
-            print(f"\n📋 Task: {task.dataset_name}")
-            sys.stdout.flush()
-            examples = task.get_examples()
-            print(f"   Examples: {len(examples)}")
-
-            # Run non-RLM models in parallel (threads)
-            all_results = {}
-            if non_rlm:
-                non_rlm_results = self._run_non_rlm_models_parallel(examples)
-                all_results.update(non_rlm_results)
-
-            # Run RLM models in parallel (process pools)
-            if rlm:
-                rlm_results = self._run_rlm_models_parallel(examples)
-                all_results.update(rlm_results)
-
-            # Assemble, save, and summarize
-            results = self._assemble_results(examples, all_results)
-            output_file = self._save_results(results, task.dataset_name)
-            self._print_summary(results, task.dataset_name, output_file)
+        # Run each task (RLM process pools are shared across tasks)
+        self._cache = LLMCache(
+            os.path.join(self.config.output_dir, ".llm_cache"), enabled=self.config.use_cache
+        )
+        try:
+            for task in self.tasks:
+                print(f"\n📋 Task: {task.dataset_name}")
+                sys.stdout.flush()
+                examples = task.get_examples()
+                print(f"   Examples: {len(examples)}")
+
+                # Run all models concurrently (direct via asyncio, RLM via process pools),
+                # streaming each example to disk as soon as all of its models are done
+                output_file = self._output_template.format(task_name=task.dataset_name)
+                with open(output_file, "wb") as f_out:
+                    totals = await self._run_task_models(examples, f_out)
+                print(f"✓ Saved {totals['count']} results to {output_file}")
+
+                self._print_summary(totals, task.dataset_name, output_file)
+        finally:
+            self.close()
 
         print("\n✅ Benchmark complete!")
 
@@ -1,6 +1,11 @@
+import os
+import pickle
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
+# Local cache for downloaded datasets and assembled examples
+DATA_DIR = "benchmarks/data"
+
 
 @dataclass
 class BenchmarkExample:
@@ -19,12 +24,53 @@ class BaseTask(ABC):
         self.split = split
         self.max_samples = max_samples
         self.examples: list[BenchmarkExample] = []
+        self._held_output: list[str] | None = None
 
     @abstractmethod
     def load(self):
         """Load the dataset and populate self.examples."""
         pass
 
+    def log(self, message: str):
+        """Print a progress line, or buffer it while output is held."""
+        if self._held_output is None:
+            print(message)
+        else:
+            self._held_output.append(message)
+
+    def hold_output(self):
+        """Buffer log() lines instead of printing them, e.g. while loading on a worker thread."""
+        self._held_output = []
+
+    def release_output(self):
+        """Print the buffered log() lines and go back to printing directly."""
+        held, self._held_output = self._held_output, None
+        for message in held or ():
+            print(message)
+
+    # Bump to invalidate cached examples when a task changes how it assembles them
+    cache_version = 1
+
+    @property
+    def cache_path(self) -> str:
+        return os.path.join(DATA_DIR, f"{self.dataset_name}_{self.split}_v{self.cache_version}.pkl")
+
+    def load_cached_examples(self) -> bool:
+        """Populate self.examples from the on-disk cache. Returns False on a cache miss."""
+        if not os.path.exists(self.cache_path):
+            return False
+        with open(self.cache_path, "rb") as f:
+            self.examples = pickle.load(f)
+        return True
+
+    def save_cached_examples(self):
+        """Write self.examples to the on-disk cache (atomically, so a crash never leaves half a file)."""
+        os.makedirs(DATA_DIR, exist_ok=True)
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self.examples, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.cache_path)
+
     def get_examples(self) -> list[BenchmarkExample]:
         """Return the loaded examples."""
         if not self.examples:
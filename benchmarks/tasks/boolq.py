@@ -1,5 +1,3 @@
-from datasets import load_dataset
-
 from .base_task import BaseTask, BenchmarkExample
 
 
@@ -17,7 +15,19 @@ class BoolQTask(BaseTask):
         super().__init__("boolq", split, max_samples)
 
     def load(self):
-        print(f"Loading BoolQ ({self.split})...")
+        self.log(f"Loading BoolQ ({self.split})...")
+        if self.load_cached_examples():
+            self.log(f"Using cached examples from {self.cache_path}")
+        else:
+            self._load_from_dataset()
+            self.save_cached_examples()
+
+        self.log(f"Loaded {len(self.examples)} BoolQ examples.")
+
+    def _load_from_dataset(self):
+        # Imported here so cache hits never pay for importing `datasets`
+        from datasets import load_dataset
+
         dataset = load_dataset("boolq", split=self.split)
 
         for item in dataset:
@@ -33,5 +43,3 @@ class BoolQTask(BaseTask):
                     reasoning_steps=None,
                 )
             )
-
-        print(f"Loaded {len(self.examples)} BoolQ examples.")
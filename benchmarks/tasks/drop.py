@@ -1,5 +1,3 @@
-from datasets import load_dataset
-
 from .base_task import BaseTask, BenchmarkExample
 
 
@@ -19,7 +17,19 @@ class DROPTask(BaseTask):
         super().__init__("drop", split, max_samples)
 
     def load(self):
-        print(f"Loading DROP ({self.split})...")
+        self.log(f"Loading DROP ({self.split})...")
+        if self.load_cached_examples():
+            self.log(f"Using cached examples from {self.cache_path}")
+        else:
+            self._load_from_dataset()
+            self.save_cached_examples()
+
+        self.log(f"Loaded {len(self.examples)} DROP examples.")
+
+    def _load_from_dataset(self):
+        # Imported here so cache hits never pay for importing `datasets`
+        from datasets import load_dataset
+
         dataset = load_dataset("drop", split=self.split)
 
         for item in dataset:
@@ -40,5 +50,3 @@ class DROPTask(BaseTask):
                     reasoning_steps=None,
                 )
             )
-
-        print(f"Loaded {len(self.examples)} DROP examples.")
@@ -1,7 +1,5 @@
 import random
 
-from datasets import load_dataset
-
 from .base_task import BaseTask, BenchmarkExample
 
 
@@ -18,7 +16,28 @@ class HotpotQATask(BaseTask):
         self.seed = seed
 
     def load(self):
-        print(f"Loading HotpotQA ({self.split})...")
+        self.log(f"Loading HotpotQA ({self.split})...")
+        if self.load_cached_examples():
+            self.log(f"Using cached examples from {self.cache_path}")
+        else:
+            self._load_from_dataset()
+            self.save_cached_examples()
+
+        # Shuffle if requested; with max_samples set, only draw the examples that will be used
+        if self.shuffle:
+            rng = random.Random(self.seed)
+            if self.max_samples and self.max_samples < len(self.examples):
+                self.examples = rng.sample(self.examples, self.max_samples)
+            else:
+                rng.shuffle(self.examples)
+            self.log(f"Shuffled {len(self.examples)} examples with seed={self.seed}")
+
+        self.log(f"Loaded {len(self.examples)} HotpotQA examples.")
+
+    def _load_from_dataset(self):
+        # Imported here so cache hits never pay for importing `datasets`
+        from datasets import load_dataset
+
         # Load 'distractor' configuration: includes hard negative paragraphs
         dataset = load_dataset("hotpot_qa", "distractor", split=self.split)
 
@@ -27,13 +46,16 @@ class HotpotQATask(BaseTask):
             # context['sentences'] is a list of lists of strings
             # context['title'] is a list of strings
 
-            context_text = ""
             titles = item["context"]["title"]
             sentences = item["context"]["sentences"]
 
+            # Build the pieces and join once instead of repeated string concatenation
+            parts = []
             for title, sent_list in zip(titles, sentences, strict=False):
-                paragraph = "".join(sent_list)
-                context_text += f"Title: {title}\n{paragraph}\n\n"
+                parts.append(f"Title: {title}\n")
+                parts.extend(sent_list)
+                parts.append("\n\n")
+            context_text = "".join(parts)
 
             self.examples.append(
                 BenchmarkExample(
@@ -44,11 +66,3 @@ class HotpotQATask(BaseTask):
                     reasoning_steps=None,  # HotpotQA doesn't provide explicit steps in this config
                 )
             )
-
-        # Shuffle if requested
-        if self.shuffle:
-            random.seed(self.seed)
-            random.shuffle(self.examples)
-            print(f"Shuffled {len(self.examples)} examples with seed={self.seed}")
-
-        print(f"Loaded {len(self.examples)} HotpotQA examples.")
@@ -12,49 +12,71 @@ class MusiqueTask(BaseTask):
         self.url = "https://raw.githubusercontent.com/stonybrooknlp/musique/main/data/musique_ans_v1.0_dev.jsonl"
 
     def load(self):
-        print(f"Loading Musique ({self.split})...")
-        data = []
+        self.log(f"Loading Musique ({self.split})...")
+        if self.load_cached_examples():
+            self.log(f"Using cached examples from {self.cache_path}")
+            self.log(f"Loaded {len(self.examples)} Musique examples.")
+            return
 
         # Try downloading directly since HF dataset loading is flaky
         cache_file = f"benchmarks/data/musique_{self.split}.jsonl"
         if not os.path.exists("benchmarks/data"):
             os.makedirs("benchmarks/data", exist_ok=True)
 
+        # Each line becomes a BenchmarkExample as soon as it is parsed; the raw records
+        # (paragraph lists included) are never held all at once
+        append = self.examples.append
         if not os.path.exists(cache_file):
-            print(f"Downloading from {self.url}...")
+            # Stream the download: each line is parsed and written to the cache as it arrives
+            self.log(f"Downloading from {self.url}...")
+            tmp_file = f"{cache_file}.tmp"
             try:
-                response = requests.get(self.url)
-                response.raise_for_status()
-                with open(cache_file, "w") as f:
-                    f.write(response.text)
+                with requests.get(self.url, stream=True) as response:
+                    # Check the status before creating the temp file, so an HTTP error leaves none
+                    response.raise_for_status()
+                    response.encoding = "utf-8"
+                    try:
+                        with open(tmp_file, "w") as f:
+                            for line in response.iter_lines(decode_unicode=True):
+                                if not line:
+                                    continue
+                                f.write(line + "\n")
+                                append(self._to_example(json.loads(line)))
+                    except BaseException:
+                        # Includes KeyboardInterrupt: never leave a partial download behind
+                        if os.path.exists(tmp_file):
+                            os.unlink(tmp_file)
+                        raise
+                os.replace(tmp_file, cache_file)
             except Exception as e:
-                print(f"Failed to download Musique: {e}")
+                self.examples.clear()
+                self.log(f"Failed to download Musique: {e}")
+                return
+        else:
+            # Load from file; json parses the UTF-8 bytes directly
+            try:
+                with open(cache_file, "rb") as f:
+                    for line in f:
+                        append(self._to_example(json.loads(line)))
+            except Exception as e:
+                self.examples.clear()
+                self.log(f"Error reading Musique file: {e}")
                 return
 
-        # Load from file
-        try:
-            with open(cache_file) as f:
-                for line in f:
-                    data.append(json.loads(line))
-        except Exception as e:
-            print(f"Error reading Musique file: {e}")
-            return
+        self.save_cached_examples()
+        self.log(f"Loaded {len(self.examples)} Musique examples.")
 
-        for item in data:
-            context_text = ""
-            for p in item["paragraphs"]:
-                context_text += f"Title: {p['title']}\n{p['paragraph_text']}\n\n"
-
-            self.examples.append(
-                BenchmarkExample(
-                    id=item["id"],
-                    question=item["question"],
-                    context=context_text.strip(),
-                    gold_answer=item["answer"],
-                    reasoning_steps=[
-                        decomp["question"] for decomp in item.get("question_decomposition", [])
-                    ],
-                )
-            )
-
-        print(f"Loaded {len(self.examples)} Musique examples.")
+    @staticmethod
+    def _to_example(item: dict) -> BenchmarkExample:
+        context_text = "".join(
+            f"Title: {p['title']}\n{p['paragraph_text']}\n\n" for p in item["paragraphs"]
+        )
+        return BenchmarkExample(
+            id=item["id"],
+            question=item["question"],
+            context=context_text.strip(),
+            gold_answer=item["answer"],
+            reasoning_steps=[
+                decomp["question"] for decomp in item.get("question_decomposition", [])
+            ],
+        )
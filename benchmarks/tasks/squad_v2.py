@@ -1,5 +1,3 @@
-from datasets import load_dataset
-
 from .base_task import BaseTask, BenchmarkExample
 
 
@@ -21,17 +19,29 @@ class SQuADv2Task(BaseTask):
         self.answerable_only = answerable_only
 
     def load(self):
-        print(f"Loading SQuAD v2 ({self.split})...")
+        self.log(f"Loading SQuAD v2 ({self.split})...")
+        if self.load_cached_examples():
+            self.log(f"Using cached examples from {self.cache_path}")
+        else:
+            self._load_from_dataset()
+            self.save_cached_examples()
+
+        # The cache holds every example; filter after loading it
+        if self.answerable_only:
+            self.examples = [e for e in self.examples if e.gold_answer != "unanswerable"]
+
+        self.log(f"Loaded {len(self.examples)} SQuAD v2 examples.")
+
+    def _load_from_dataset(self):
+        # Imported here so cache hits never pay for importing `datasets`
+        from datasets import load_dataset
+
         dataset = load_dataset("squad_v2", split=self.split)
 
         for item in dataset:
             # Check if answerable
             answers = item["answers"]["text"]
             is_answerable = len(answers) > 0
-
-            if self.answerable_only and not is_answerable:
-                continue
-
             gold_answer = answers[0] if is_answerable else "unanswerable"
 
             self.examples.append(
@@ -43,5 +53,3 @@ class SQuADv2Task(BaseTask):
                     reasoning_steps=None,
                 )
             )
-
-        print(f"Loaded {len(self.examples)} SQuAD v2 examples.")
@@ -1,36 +1,64 @@
 import argparse
-import json
 import os
-import sys
+import re
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from itertools import chain
 
-# Add benchmarks directory to path for imports
-_benchmarks_dir = os.path.dirname(os.path.abspath(__file__))
-if _benchmarks_dir not in sys.path:
-    sys.path.insert(0, _benchmarks_dir)
+# Run as a script, the benchmarks directory is already sys.path[0]; no path patching needed
+if __package__:
+    from .pricing import calculate_cost
+else:
+    from pricing import calculate_cost
 
-from pricing import calculate_cost  # noqa: E402
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
+# Runner output names end in the run timestamp: <task>_results_YYYYMMDD_HHMMSS.jsonl
+_RUN_ID_RE = re.compile(r"(\d{8}_\d{6})\.jsonl$")
 
-def load_results(filepath: str) -> list[dict]:
-    results = []
-    with open(filepath) as f:
+
+def iter_results(filepath: str) -> Iterator[dict]:
+    """Yield one parsed result per JSONL line without holding the whole file in memory."""
+    # Binary mode: both orjson and json parse the UTF-8 bytes directly, no per-line str decode
+    with open(filepath, "rb", buffering=1 << 16) as f:
         for line in f:
-            if line.strip():
-                results.append(json.loads(line))
-    return results
+            # Skip blank and whitespace-only lines (including CRLF ones) without allocating a
+            # stripped copy; isspace() stops at the first non-space byte of a real record
+            if not line.isspace():
+                yield _loads(line)
+
+
+def load_results(filepath: str) -> list[dict]:
+    return list(iter_results(filepath))
 
 
 def extract_run_id(filepath: str) -> str:
     """Extract run_id from filename like 'hotpot_qa_results_20260105_123456.jsonl'"""
-    basename = os.path.basename(filepath)
-    parts = basename.split("_")
-    if len(parts) >= 3:
-        # Expecting format: taskname_results_RUNID.jsonl
-        return parts[-1].replace(".jsonl", "")
+    match = _RUN_ID_RE.search(os.path.basename(filepath))
+    if match:
+        return match.group(1)
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
+# Characters that would break a markdown table cell
+_CELL_ESCAPES = str.maketrans({"|": "\\|", "\n": " ", "\r": " "})
+
+
+def _cell(s: str) -> str:
+    """Make `s` safe to put in a table cell."""
+    return s.translate(_CELL_ESCAPES)
+
+
+def _preview(s: str, n: int = 80) -> str:
+    """Truncate to `n` characters (before escaping, so `\\|` is never split) and make table-safe."""
+    if len(s) > n:
+        s = s[:n] + "..."
+    return _cell(s)
+
+
 def get_model_cost(model_result: dict) -> float:
     """Calculate cost for a single model result."""
     model_id = model_result.get("model", "")
@@ -51,129 +79,261 @@ def get_model_cost(model_result: dict) -> float:
     return calculate_cost(total_input, total_output, model_id)
 
 
-def generate_markdown_report(results: list[dict], run_id: str, output_dir: str):
-    """Generate comprehensive markdown report."""
-
-    # Extract model names from first result
-    model_names = list(results[0]["models"].keys())
-    total = len(results)
+def _row_costs(result: dict, model_names: list[str]) -> dict[str, float]:
+    models = result["models"]
+    return {name: get_model_cost(models[name]) for name in model_names}
+
+
+def compute_costs(results: list[dict], model_names: list[str]) -> list[dict[str, float]]:
+    """Cost of every (example, model) result, computed once and shared by all report sections."""
+    return [_row_costs(r, model_names) for r in results]
+
+
+def aggregate_metrics(
+    rows: Iterable[tuple[dict, dict[str, float]]], model_names: list[str]
+) -> tuple[int, dict[str, dict]]:
+    """
+    Per-model averages plus head-to-head tallies vs the first (baseline) model, in one pass.
+
+    `rows` yields (result, costs) pairs and may be a stream; returns (example count, metrics).
+    """
+    total = 0
+    baseline = model_names[0]
+    sums = {
+        name: {
+            "em": 0,
+            "f1": 0.0,
+            "time": 0.0,
+            "calls": 0,
+            "cost": 0.0,
+            "wins": 0,
+            "losses": 0,
+            "ties": 0,
+        }
+        for name in model_names
+    }
+
+    for r, row_costs in rows:
+        total += 1
+        models = r["models"]
+        baseline_f1 = models[baseline]["f1"]
+        for name in model_names:
+            m = models[name]
+            acc = sums[name]
+            acc["em"] += bool(m["em"])
+            f1 = m["f1"]
+            acc["f1"] += f1
+            acc["time"] += m["time"]
+            acc["calls"] += m["llm_calls"]
+            acc["cost"] += row_costs[name]
+            if f1 > baseline_f1:
+                acc["wins"] += 1
+            elif f1 < baseline_f1:
+                acc["losses"] += 1
+            else:
+                acc["ties"] += 1
 
-    # Calculate aggregate metrics
     metrics = {}
-    for model_name in model_names:
-        em_count = sum(1 for r in results if r["models"][model_name]["em"])
-        avg_f1 = sum(r["models"][model_name]["f1"] for r in results) / total
-        avg_time = sum(r["models"][model_name]["time"] for r in results) / total
-        avg_calls = sum(r["models"][model_name]["llm_calls"] for r in results) / total
-        avg_cost = sum(get_model_cost(r["models"][model_name]) for r in results) / total
-
-        metrics[model_name] = {
-            "em": em_count,
-            "em_pct": em_count / total * 100,
+    for name, acc in sums.items():
+        avg_f1 = acc["f1"] / total
+        avg_time = acc["time"] / total
+        avg_calls = acc["calls"] / total
+        avg_cost = acc["cost"] / total
+        metrics[name] = {
+            "em": acc["em"],
+            "em_pct": acc["em"] / total * 100,
             "avg_f1": avg_f1,
             "avg_time": avg_time,
             "avg_calls": avg_calls,
             "avg_cost": avg_cost,
+            "wins": acc["wins"],
+            "losses": acc["losses"],
+            "ties": acc["ties"],
+            # Display strings, formatted once and reused by every table
+            "s_em_frac": f"{acc['em']}/{total}",
+            "s_avg_f1": f"{avg_f1:.3f}",
+            "s_avg_time": f"{avg_time:.2f}",
+            "s_avg_calls": f"{avg_calls:.1f}",
+            "s_cost_cents": f"{avg_cost * 100:.2f}¢",
         }
+    return total, metrics
+
+
+def summarize_file(filepath: str) -> tuple[int, list[str], dict[str, dict]]:
+    """Aggregate a results file while streaming it; no per-example result is kept."""
+    rows = iter_results(filepath)
+    first = next(rows, None)
+    if first is None:
+        return 0, [], {}
+    model_names = list(first["models"].keys())
+    pairs = ((r, _row_costs(r, model_names)) for r in chain((first,), rows))
+    total, metrics = aggregate_metrics(pairs, model_names)
+    return total, model_names, metrics
+
+
+def _iter_example_md(
+    results: list[dict], model_names: list[str], costs: list[dict[str, float]]
+) -> Iterator[str]:
+    """Yield the Sample Comparisons markdown one example at a time, so memory stays flat."""
+    example_row = "| {} | {} | {:.2f} | {} | {:.1f}s | {} | {:.2f}¢ |\n".format
+    preview = _preview
+    name_cells = {name: _cell(name) for name in model_names}
+    for i, (r, row_costs) in enumerate(zip(results, costs, strict=True), 1):
+        parts = [
+            f"### Example {i}\n\n",
+            f"**Question:** {r['question']}\n\n",
+            f"**Gold Answer:** `{r['gold_answer']}`\n\n",
+            "| Model | Answer | F1 | EM | Time | Calls | Cost (¢) |\n",
+            "|-------|--------|----|----|------|-------|----------|\n",
+        ]
+        out = parts.append
+
+        models = r["models"]
+        best_f1 = -1.0
+        best_model = None
+        for model_name in model_names:
+            m = models[model_name]
+            f1 = m["f1"]
+            if f1 > best_f1:
+                best_f1 = f1
+                best_model = model_name
+            out(
+                example_row(
+                    name_cells[model_name],
+                    preview(m["answer"]),
+                    f1,
+                    "✓" if m["em"] else "✗",
+                    m["time"],
+                    m["llm_calls"],
+                    row_costs[model_name] * 100,
+                )
+            )
+
+        # Highlight winner
+        out(f"\n**Winner:** {best_model}\n\n")
+        out("---\n\n")
+        yield "".join(parts)
+
+
+def generate_markdown_report(
+    results: list[dict],
+    run_id: str,
+    output_dir: str,
+    model_names: list[str] | None = None,
+    metrics: dict[str, dict] | None = None,
+    costs: list[dict[str, float]] | None = None,
+    source_mtime: float | None = None,
+):
+    """Generate comprehensive markdown report. `source_mtime` dates the results file itself.
+
+    `model_names`, `metrics` and `costs` let a caller that already computed them (like main())
+    share them with the console summary; any left out are computed from `results`.
+    """
+    total = len(results)
+    if model_names is None:
+        model_names = list(results[0]["models"].keys())
+    if costs is None:
+        costs = compute_costs(results, model_names)
+    if metrics is None:
+        _, metrics = aggregate_metrics(zip(results, costs, strict=True), model_names)
 
     # Generate markdown
     report_path = os.path.join(output_dir, f"report_{run_id}.md")
 
-    with open(report_path, "w") as f:
-        f.write(f"# Benchmark Report: {run_id}\n\n")
-        f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        f.write(f"**Total Examples:** {total}\n\n")
-        f.write("---\n\n")
+    parts: list[str] = []
+    out = parts.append
 
-        # Overall Results Table
-        f.write("## Overall Results\n\n")
-        f.write("| Model | EM | EM % | Avg F1 | Avg Time (s) | Avg LLM Calls | Avg Cost (¢) |\n")
-        f.write("|-------|----|----|--------|--------------|---------------|-------------|\n")
+    # Row template is parsed once; the bound .format is reused for every row
+    overall_row = "| {} | {} | {:.1f}% | {} | {} | {} | {} |\n".format
 
-        for model_name in model_names:
-            m = metrics[model_name]
-            cost_cents = m["avg_cost"] * 100
-            f.write(
-                f"| {model_name} | {m['em']}/{total} | {m['em_pct']:.1f}% | {m['avg_f1']:.3f} | {m['avg_time']:.2f} | {m['avg_calls']:.1f} | {cost_cents:.2f}¢ |\n"
-            )
+    out(f"# Benchmark Report: {run_id}\n\n")
+    out(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    if source_mtime is not None:
+        source_time = datetime.fromtimestamp(source_mtime).strftime("%Y-%m-%d %H:%M:%S")
+        out(f"**Results Written:** {source_time}\n\n")
+    out(f"**Total Examples:** {total}\n\n")
+    out("---\n\n")
 
-        f.write("\n---\n\n")
+    # Overall Results Table
+    out("## Overall Results\n\n")
+    out("| Model | EM | EM % | Avg F1 | Avg Time (s) | Avg LLM Calls | Avg Cost (¢) |\n")
+    out("|-------|----|----|--------|--------------|---------------|-------------|\n")
 
-        # Head-to-Head Comparison (each model vs baseline)
-        baseline = model_names[0]  # First model is baseline
-        f.write(f"## Head-to-Head vs Baseline ({baseline})\n\n")
-        f.write("| Model | Wins | Losses | Ties | Win Rate |\n")
-        f.write("|-------|------|--------|------|----------|\n")
-
-        for model_name in model_names[1:]:
-            wins = sum(
-                1 for r in results if r["models"][model_name]["f1"] > r["models"][baseline]["f1"]
-            )
-            losses = sum(
-                1 for r in results if r["models"][model_name]["f1"] < r["models"][baseline]["f1"]
-            )
-            ties = sum(
-                1 for r in results if r["models"][model_name]["f1"] == r["models"][baseline]["f1"]
+    # Key Insights leaders are picked while emitting the table (first model wins ties)
+    best_f1_model = fastest_model = efficient_model = model_names[0]
+    for model_name in model_names:
+        m = metrics[model_name]
+        if m["avg_f1"] > metrics[best_f1_model]["avg_f1"]:
+            best_f1_model = model_name
+        if m["avg_time"] < metrics[fastest_model]["avg_time"]:
+            fastest_model = model_name
+        if m["avg_calls"] < metrics[efficient_model]["avg_calls"]:
+            efficient_model = model_name
+        out(
+            overall_row(
+                _cell(model_name),
+                m["s_em_frac"],
+                m["em_pct"],
+                m["s_avg_f1"],
+                m["s_avg_time"],
+                m["s_avg_calls"],
+                m["s_cost_cents"],
             )
-            win_rate = wins / total * 100
+        )
 
-            f.write(f"| {model_name} | {wins} | {losses} | {ties} | {win_rate:.1f}% |\n")
+    out("\n---\n\n")
 
-        f.write("\n---\n\n")
+    # Head-to-Head Comparison (each model vs baseline)
+    baseline = model_names[0]  # First model is baseline
+    out(f"## Head-to-Head vs Baseline ({baseline})\n\n")
+    out("| Model | Wins | Losses | Ties | Win Rate |\n")
+    out("|-------|------|--------|------|----------|\n")
 
-        # Key Insights
-        f.write("## Key Insights\n\n")
+    for model_name in model_names[1:]:
+        m = metrics[model_name]
+        win_rate = m["wins"] / total * 100
 
-        # Best F1
-        best_f1_model = max(model_names, key=lambda m: metrics[m]["avg_f1"])
-        f.write(f"- **Best F1 Score:** {best_f1_model} ({metrics[best_f1_model]['avg_f1']:.3f})\n")
+        out(
+            f"| {_cell(model_name)} | {m['wins']} | {m['losses']} | {m['ties']} | {win_rate:.1f}% |\n"
+        )
 
-        # Fastest
-        fastest_model = min(model_names, key=lambda m: metrics[m]["avg_time"])
-        f.write(f"- **Fastest:** {fastest_model} ({metrics[fastest_model]['avg_time']:.2f}s avg)\n")
+    out("\n---\n\n")
 
-        # Most efficient (fewest calls)
-        efficient_model = min(model_names, key=lambda m: metrics[m]["avg_calls"])
-        f.write(
-            f"- **Most Efficient (Fewest Calls):** {efficient_model} ({metrics[efficient_model]['avg_calls']:.1f} calls avg)\n"
-        )
+    # Key Insights
+    out("## Key Insights\n\n")
 
-        f.write("\n---\n\n")
+    # Best F1
+    out(f"- **Best F1 Score:** {best_f1_model} ({metrics[best_f1_model]['s_avg_f1']})\n")
 
-        # Sample Comparisons - show all examples
-        num_to_show = len(results)
-        f.write(f"## Sample Comparisons (All {num_to_show} Examples)\n\n")
+    # Fastest
+    out(f"- **Fastest:** {fastest_model} ({metrics[fastest_model]['s_avg_time']}s avg)\n")
 
-        for i, r in enumerate(results, 1):
-            f.write(f"### Example {i}\n\n")
-            f.write(f"**Question:** {r['question']}\n\n")
-            f.write(f"**Gold Answer:** `{r['gold_answer']}`\n\n")
+    # Most efficient (fewest calls)
+    out(
+        f"- **Most Efficient (Fewest Calls):** {efficient_model} ({metrics[efficient_model]['s_avg_calls']} calls avg)\n"
+    )
 
-            f.write("| Model | Answer | F1 | EM | Time | Calls | Cost (¢) |\n")
-            f.write("|-------|--------|----|----|------|-------|----------|\n")
+    out("\n---\n\n")
 
-            for model_name in model_names:
-                m = r["models"][model_name]
-                answer_preview = m["answer"][:80] + "..." if len(m["answer"]) > 80 else m["answer"]
-                cost = get_model_cost(m)
-                cost_cents = cost * 100
-                f.write(
-                    f"| {model_name} | {answer_preview} | {m['f1']:.2f} | {'✓' if m['em'] else '✗'} | {m['time']:.1f}s | {m['llm_calls']} | {cost_cents:.2f}¢ |\n"
-                )
+    # Sample Comparisons - show all examples
+    num_to_show = len(results)
+    out(f"## Sample Comparisons (All {num_to_show} Examples)\n\n")
 
-            # Highlight winner
-            best_model = max(model_names, key=lambda m: r["models"][m]["f1"])
-            f.write(f"\n**Winner:** {best_model}\n\n")
-            f.write("---\n\n")
+    # Header sections are small and written in one go; examples are streamed one at a time
+    with open(report_path, "w", buffering=1 << 20) as f:
+        f.write("".join(parts))
+        for chunk in _iter_example_md(results, model_names, costs):
+            f.write(chunk)
 
     return report_path
 
 
-def print_console_summary(results: list[dict]):
-    """Print summary to console."""
-    model_names = list(results[0]["models"].keys())
-    total = len(results)
+# Console summary row; metric values arrive pre-formatted from aggregate_metrics
+_SUMMARY_ROW = "{:<30} | {} ({:.0%})   | {}    | {}s      | {}      | {}".format
+
 
+def print_console_summary(total: int, model_names: list[str], metrics: dict[str, dict]):
+    """Print summary to console."""
     print("\n" + "=" * 90)
     print(f"BENCHMARK RESULTS (n={total})")
     print("=" * 90)
@@ -183,15 +343,17 @@ def print_console_summary(results: list[dict]):
     print("-" * 90)
 
     for model_name in model_names:
-        em_count = sum(1 for r in results if r["models"][model_name]["em"])
-        avg_f1 = sum(r["models"][model_name]["f1"] for r in results) / total
-        avg_time = sum(r["models"][model_name]["time"] for r in results) / total
-        avg_calls = sum(r["models"][model_name]["llm_calls"] for r in results) / total
-        avg_cost = sum(get_model_cost(r["models"][model_name]) for r in results) / total
-        avg_cost_cents = avg_cost * 100
-
+        m = metrics[model_name]
         print(
-            f"{model_name:<30} | {em_count}/{total} ({em_count / total:.0%}){'':<2} | {avg_f1:.3f}    | {avg_time:.2f}s      | {avg_calls:.1f}      | {avg_cost_cents:.2f}¢"
+            _SUMMARY_ROW(
+                model_name,
+                m["s_em_frac"],
+                m["em"] / total,
+                m["s_avg_f1"],
+                m["s_avg_time"],
+                m["s_avg_calls"],
+                m["s_cost_cents"],
+            )
         )
 
     print("=" * 90)
@@ -200,12 +362,28 @@ def print_console_summary(results: list[dict]):
 def main():
     parser = argparse.ArgumentParser(description="View RLM benchmark results and generate report")
     parser.add_argument("--file", type=str, required=True, help="Path to results file")
+    parser.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="Stream the file and print the console summary only (no markdown report)",
+    )
     args = parser.parse_args()
 
-    if not os.path.exists(args.file):
+    # One stat both validates the path and gives the source timestamp for the report
+    try:
+        source_stat = os.stat(args.file)
+    except FileNotFoundError:
         print(f"Error: Results file not found at {args.file}")
         return
 
+    if args.summary_only:
+        total, model_names, metrics = summarize_file(args.file)
+        if not total:
+            print("No results found.")
+            return
+        print_console_summary(total, model_names, metrics)
+        return
+
     results = load_results(args.file)
     if not results:
         print("No results found.")
@@ -213,13 +391,20 @@ def main():
 
     # Extract run_id from filename
     run_id = extract_run_id(args.file)
-    output_dir = os.path.dirname(args.file)
+    output_dir, _ = os.path.split(args.file)
+
+    # Costs and aggregates are computed once and shared by the console and markdown outputs
+    model_names = list(results[0]["models"].keys())
+    costs = compute_costs(results, model_names)
+    total, metrics = aggregate_metrics(zip(results, costs, strict=True), model_names)
 
     # Print console summary
-    print_console_summary(results)
+    print_console_summary(total, model_names, metrics)
 
     # Generate markdown report
-    report_path = generate_markdown_report(results, run_id, output_dir)
+    report_path = generate_markdown_report(
+        results, run_id, output_dir, model_names, metrics, costs, source_stat.st_mtime
+    )
     print(f"\n📄 Markdown report generated: {report_path}")
 
 
@@ -7,12 +7,26 @@ A conversational interface that always starts with human_query() to ask what you
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
 from dotenv import load_dotenv
 
 from rlm import RLM
 
 load_dotenv()
 
+# Larger files would blow past any model's context window anyway
+MAX_CONTEXT_BYTES = 2_000_000
+
+
+def _read_text_file(path: str) -> str:
+    """Read a UTF-8 file in one shot, refusing files over MAX_CONTEXT_BYTES before reading."""
+    size = os.stat(path).st_size
+    if size > MAX_CONTEXT_BYTES:
+        raise ValueError(f"File too large ({size} B > {MAX_CONTEXT_BYTES} B)")
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8')
+
 
 def load_context_files(file_paths_str: str) -> dict | None:
     """Load multiple context files from comma/space-separated paths.
@@ -36,25 +50,29 @@ def load_context_files(file_paths_str: str) -> dict | None:
         # Check if path is a directory
         if os.path.isdir(path):
             try:
-                # List all non-hidden files in directory (non-recursive)
-                files_in_dir = [
-                    os.path.join(path, f) 
-                    for f in os.listdir(path) 
-                    if not f.startswith('.') and os.path.isfile(os.path.join(path, f))
-                ]
+                # List all non-hidden files in directory (non-recursive).
+                # scandir entries carry their file type, so is_file() needs no extra stat.
+                with os.scandir(path) as it:
+                    files_in_dir = [
+                        entry.path
+                        for entry in it
+                        if not entry.name.startswith('.') and entry.is_file()
+                    ]
                 
                 if not files_in_dir:
                     errors.append(f"No readable files in directory: {path}")
                     continue
                 
-                # Try to read all files - if any fail, fail the entire directory
+                # Try to read all files - if any fail, fail the entire directory.
+                # Reads are pure I/O, so they overlap on a small thread pool; results are
+                # collected in directory order to keep the context layout stable.
                 dir_contents = {}
                 dir_errors = []
-                for file_path in files_in_dir:
+                with ThreadPoolExecutor(max_workers=min(16, len(files_in_dir))) as pool:
+                    futures = [(p, pool.submit(_read_text_file, p)) for p in files_in_dir]
+                for file_path, future in futures:
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            dir_contents[file_path] = content
+                        dir_contents[file_path] = future.result()
                     except UnicodeDecodeError:
                         dir_errors.append(f"Cannot read as text (binary?): {file_path}")
                     except Exception as e:
@@ -75,9 +93,7 @@ def load_context_files(file_paths_str: str) -> dict | None:
         else:
             # Regular file
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    context_data[path] = content
+                context_data[path] = _read_text_file(path)
             except FileNotFoundError:
                 errors.append(f"File not found: {path}")
             except UnicodeDecodeError:
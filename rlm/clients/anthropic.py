@@ -17,6 +17,7 @@ class AnthropicClient(BaseLM):
         api_key: str,
         model_name: str | None = None,
         max_tokens: int = 32768,
+        cache_system_prompt: bool = False,
         **kwargs,
     ):
         super().__init__(model_name=model_name, **kwargs)
@@ -24,12 +25,16 @@ class AnthropicClient(BaseLM):
         self.async_client = anthropic.AsyncAnthropic(api_key=api_key)
         self.model_name = model_name
         self.max_tokens = max_tokens
+        self.cache_system_prompt = cache_system_prompt
 
         # Per-model usage tracking
         self.model_call_counts: dict[str, int] = defaultdict(int)
         self.model_input_tokens: dict[str, int] = defaultdict(int)
         self.model_output_tokens: dict[str, int] = defaultdict(int)
         self.model_total_tokens: dict[str, int] = defaultdict(int)
+        # Prompt-cache tokens, billed at different rates than uncached input tokens
+        self.model_cache_write_tokens: dict[str, int] = defaultdict(int)
+        self.model_cache_read_tokens: dict[str, int] = defaultdict(int)
 
     def completion(self, prompt: str | list[dict[str, Any]], model: str | None = None) -> str:
         messages, system = self._prepare_messages(prompt)
@@ -40,7 +45,7 @@ class AnthropicClient(BaseLM):
 
         kwargs = {"model": model, "max_tokens": self.max_tokens, "messages": messages}
         if system:
-            kwargs["system"] = system
+            kwargs["system"] = self._system_param(system)
 
         response = self.client.messages.create(**kwargs)
         self._track_cost(response, model)
@@ -57,7 +62,7 @@ class AnthropicClient(BaseLM):
 
         kwargs = {"model": model, "max_tokens": self.max_tokens, "messages": messages}
         if system:
-            kwargs["system"] = system
+            kwargs["system"] = self._system_param(system)
 
         response = await self.async_client.messages.create(**kwargs)
         self._track_cost(response, model)
@@ -84,15 +89,29 @@ class AnthropicClient(BaseLM):
 
         return messages, system
 
+    def _system_param(self, system: str) -> str | list[dict[str, Any]]:
+        """Return the system prompt, marked as a cacheable prefix if cache_system_prompt is set.
+
+        The RLM system prompt is identical on every iteration of every completion, so with caching
+        later calls read it from Anthropic's prompt cache instead of re-processing it.
+        """
+        if not self.cache_system_prompt:
+            return system
+        return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
     def _track_cost(self, response: anthropic.types.Message, model: str):
+        usage = response.usage
         self.model_call_counts[model] += 1
-        self.model_input_tokens[model] += response.usage.input_tokens
-        self.model_output_tokens[model] += response.usage.output_tokens
-        self.model_total_tokens[model] += response.usage.input_tokens + response.usage.output_tokens
+        self.model_input_tokens[model] += usage.input_tokens
+        self.model_output_tokens[model] += usage.output_tokens
+        self.model_total_tokens[model] += usage.input_tokens + usage.output_tokens
+        # Reported separately from input_tokens; None when the request used no cache_control
+        self.model_cache_write_tokens[model] += usage.cache_creation_input_tokens or 0
+        self.model_cache_read_tokens[model] += usage.cache_read_input_tokens or 0
 
         # Track last call for handler to read
-        self.last_prompt_tokens = response.usage.input_tokens
-        self.last_completion_tokens = response.usage.output_tokens
+        self.last_prompt_tokens = usage.input_tokens
+        self.last_completion_tokens = usage.output_tokens
 
     def get_usage_summary(self) -> UsageSummary:
         model_summaries = {}
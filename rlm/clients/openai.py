@@ -2,6 +2,7 @@ import os
 from collections import defaultdict
 from typing import Any
 
+import httpx
 import openai
 from dotenv import load_dotenv
 
@@ -19,6 +20,10 @@ DEFAULT_PRIME_INTELLECT_BASE_URL = "https://api.pinference.ai/api/v1/"
 class OpenAIClient(BaseLM):
     """
     LM Client for running models with the OpenAI API. Works with vLLM as well.
+
+    Pass `http_client` (e.g. one `openai.DefaultHttpxClient` per process) to reuse TCP/TLS
+    connections across clients; RLM builds a new client per completion, so without it every
+    completion starts from an empty connection pool.
     """
 
     def __init__(
@@ -26,6 +31,7 @@ class OpenAIClient(BaseLM):
         api_key: str | None = None,
         model_name: str | None = None,
         base_url: str | None = None,
+        http_client: httpx.Client | None = None,
         **kwargs,
     ):
         super().__init__(model_name=model_name, **kwargs)
@@ -38,7 +44,7 @@ class OpenAIClient(BaseLM):
 
         # For vLLM, set base_url to local vLLM server address.
         self.base_url = base_url  # Store for use in async methods
-        self.client = openai.OpenAI(api_key=api_key, base_url=base_url)
+        self.client = openai.OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
         self.async_client = openai.AsyncOpenAI(api_key=api_key, base_url=base_url)
         self.model_name = model_name
 
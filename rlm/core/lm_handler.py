@@ -69,8 +69,15 @@ class LMRequestHandler(StreamRequestHandler):
         start_time = time.perf_counter()
 
         async def run_all():
-            tasks = [client.acompletion(prompt) for prompt in request.prompts]
-            return await asyncio.gather(*tasks)
+            # Created inside the loop it guards; caps in-flight calls so large batches
+            # do not trip provider rate limits
+            semaphore = asyncio.Semaphore(handler.max_batch_concurrency)
+
+            async def run_one(prompt):
+                async with semaphore:
+                    return await client.acompletion(prompt)
+
+            return await asyncio.gather(*(run_one(prompt) for prompt in request.prompts))
 
         results = asyncio.run(run_all())
         end_time = time.perf_counter()
@@ -112,8 +119,12 @@ class LMHandler:
         client: BaseLM,
         host: str = "127.0.0.1",
         port: int = 0,  # auto-assign available port
+        max_batch_concurrency: int = 16,  # max in-flight calls per llm_query_batched request
     ):
+        if max_batch_concurrency < 1:
+            raise ValueError(f"max_batch_concurrency must be >= 1, got {max_batch_concurrency}")
         self.default_client = client
+        self.max_batch_concurrency = max_batch_concurrency
         self.clients: dict[str, BaseLM] = {}
         self.host = host
         self._server: ThreadingLMServer | None = None
@@ -51,6 +51,7 @@ class RLM:
         other_backend_kwargs: list[dict[str, Any]] | None = None,
         logger: RLMLogger | None = None,
         verbose: bool = False,
+        max_batch_concurrency: int = 16,
     ):
         """
         Args:
@@ -66,6 +67,7 @@ class RLM:
             other_backend_kwargs: The kwargs to pass to the other client backends (ordered to match other_backends).
             logger: The logger to use for the RLM.
             verbose: Whether to print verbose output in rich to console.
+            max_batch_concurrency: The maximum number of in-flight sub-calls per llm_query_batched request.
         """
         # Store config for spawning per-completion
         self.backend = backend
@@ -80,6 +82,7 @@ class RLM:
         self.depth = depth
         self.max_depth = max_depth
         self.max_iterations = max_iterations
+        self.max_batch_concurrency = max_batch_concurrency
         self.system_prompt = custom_system_prompt if custom_system_prompt else RLM_SYSTEM_PROMPT
         self.logger = logger
         self.verbose = VerbosePrinter(enabled=verbose)
@@ -102,17 +105,18 @@ class RLM:
             )
             if self.logger:
                 self.logger.log_metadata(metadata)
+                self.logger.close()
             self.verbose.print_metadata(metadata)
 
     @contextmanager
     def _spawn_completion_context(self, prompt: str | dict[str, Any]):
         """
         Spawn an LM handler and environment for a single completion call.
-        Cleans up both when the context exits.
+        Cleans up both, and closes the logger, when the context exits.
         """
         # Create client and wrap in handler
         client: BaseLM = get_client(self.backend, self.backend_kwargs)
-        lm_handler = LMHandler(client)
+        lm_handler = LMHandler(client, max_batch_concurrency=self.max_batch_concurrency)
 
         # Register other clients to be available as sub-call options
         if self.other_backends and self.other_backend_kwargs:
@@ -137,6 +141,8 @@ class RLM:
             lm_handler.stop()
             if hasattr(environment, "cleanup"):
                 environment.cleanup()
+            if self.logger:
+                self.logger.close()
 
     def _setup_prompt(self, prompt: str | dict[str, Any]) -> list[dict[str, Any]]:
         """
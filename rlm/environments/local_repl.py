@@ -110,6 +110,41 @@ _SAFE_BUILTINS = {
     "locals": None,
 }
 
+# =============================================================================
+# Output Capture
+# =============================================================================
+
+# Characters of stdout/stderr kept per execution; well above what format_iteration shows the LM
+MAX_CAPTURED_OUTPUT_CHARS = 1_000_000
+
+
+class _BoundedStringIO(io.StringIO):
+    """StringIO that keeps the first `limit` characters and only counts the rest.
+
+    Writes never fail, so code keeps running after a runaway print loop; it just stops
+    accumulating output that would be truncated away anyway.
+    """
+
+    def __init__(self, limit: int):
+        super().__init__()
+        self.limit = limit
+        self.dropped = 0
+
+    def write(self, s: str) -> int:
+        n = len(s)
+        room = max(self.limit - self.tell(), 0)
+        if n > room:
+            self.dropped += n - room
+            s = s[:room]
+        super().write(s)
+        return n
+
+    def getvalue(self) -> str:
+        value = super().getvalue()
+        if self.dropped:
+            value += f"... + [{self.dropped} chars dropped from captured output]"
+        return value
+
 
 class LocalREPL(NonIsolatedEnv):
     """
@@ -241,7 +276,8 @@ class LocalREPL(NonIsolatedEnv):
         """Thread-safe context manager to capture stdout/stderr."""
         with self._lock:
             old_stdout, old_stderr = sys.stdout, sys.stderr
-            stdout_buf, stderr_buf = io.StringIO(), io.StringIO()
+            stdout_buf = _BoundedStringIO(MAX_CAPTURED_OUTPUT_CHARS)
+            stderr_buf = _BoundedStringIO(MAX_CAPTURED_OUTPUT_CHARS)
             try:
                 sys.stdout, sys.stderr = stdout_buf, stderr_buf
                 yield stdout_buf, stderr_buf
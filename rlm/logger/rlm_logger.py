@@ -4,6 +4,7 @@ Logger for RLM iterations.
 Writes RLMIteration data to JSON-lines files for analysis and debugging.
 """
 
+import gzip
 import json
 import os
 import uuid
@@ -11,20 +12,62 @@ from datetime import datetime
 
 from rlm.core.types import RLMIteration, RLMMetadata
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class RLMLogger:
-    """Logger that writes RLMIteration data to a JSON-lines file."""
 
-    def __init__(self, log_dir: str, file_name: str = "rlm"):
+def _encode_line(entry: dict) -> bytes:
+    """Encode one JSONL line, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(entry) + "\n").encode()
+
+
+class RLMLogger:
+    """Logger that writes RLMIteration data to a JSON-lines file.
+
+    The file is opened on the first write and kept open. Entries are buffered and flushed every
+    `flush_every` entries and on close(); pass flush_every=1 to tail a trajectory while the RLM is
+    still running. RLM closes the logger after writing metadata and at the end of every
+    completion; when logging directly, call close() or use the logger as a context manager.
+
+    With compress=True the file is gzip-compressed (`.jsonl.gz`); each flush ends a deflate
+    block, so `zcat` can read everything flushed so far.
+    """
+
+    def __init__(
+        self, log_dir: str, file_name: str = "rlm", compress: bool = False, flush_every: int = 10
+    ):
+        if flush_every < 1:
+            raise ValueError(f"flush_every must be >= 1, got {flush_every}")
         self.log_dir = log_dir
         os.makedirs(log_dir, exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         run_id = str(uuid.uuid4())[:8]
-        self.log_file_path = os.path.join(log_dir, f"{file_name}_{timestamp}_{run_id}.jsonl")
+        extension = ".jsonl.gz" if compress else ".jsonl"
+        self.log_file_path = os.path.join(log_dir, f"{file_name}_{timestamp}_{run_id}{extension}")
+        self.compress = compress
+        self.flush_every = flush_every
 
         self._iteration_count = 0
         self._metadata_logged = False
+        self._file = None
+        self._unflushed = 0
+
+    def _write(self, entry: dict):
+        if self._file is None:
+            if self.compress:
+                self._file = gzip.open(self.log_file_path, "ab", compresslevel=6)
+            else:
+                self._file = open(self.log_file_path, "ab", buffering=1 << 20)
+        self._file.write(_encode_line(entry))
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self._file.flush()
+            self._unflushed = 0
 
     def log_metadata(self, metadata: RLMMetadata):
         """Log RLM metadata as the first entry in the file."""
@@ -36,10 +79,7 @@ class RLMLogger:
             "timestamp": datetime.now().isoformat(),
             **metadata.to_dict(),
         }
-
-        with open(self.log_file_path, "a") as f:
-            json.dump(entry, f)
-            f.write("\n")
+        self._write(entry)
 
         self._metadata_logged = True
 
@@ -53,10 +93,21 @@ class RLMLogger:
             "timestamp": datetime.now().isoformat(),
             **iteration.to_dict(),
         }
+        self._write(entry)
+
+    def close(self):
+        """Close the log file. A later log() call reopens it in append mode."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._unflushed = 0
+
+    def __enter__(self):
+        return self
 
-        with open(self.log_file_path, "a") as f:
-            json.dump(entry, f)
-            f.write("\n")
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
 
     @property
     def iteration_count(self) -> int:
@@ -1,10 +1,10 @@
-import textwrap
+from functools import lru_cache
 
 from rlm.core.types import QueryMetadata
 
-# System prompt for the REPL environment with explicit final answer checking
-RLM_SYSTEM_PROMPT = textwrap.dedent(
-    """You are tasked with answering a query with associated context. You can access, transform, and analyze this context interactively in a REPL environment that can recursively query sub-LLMs, which you are strongly encouraged to use as much as possible. You will be queried iteratively until you provide a final answer.
+# System prompt for the REPL environment with explicit final answer checking.
+# Written flush-left, so it is used verbatim (no dedent pass at import).
+RLM_SYSTEM_PROMPT = """You are tasked with answering a query with associated context. You can access, transform, and analyze this context interactively in a REPL environment that can recursively query sub-LLMs, which you are strongly encouraged to use as much as possible. You will be queried iteratively until you provide a final answer.
 
 The REPL environment is initialized with:
 1. A `context` variable that contains extremely important information about your query. You should check the content of the `context` variable to understand what you are working with. Make sure you look through it sufficiently as you answer your query.
@@ -28,8 +28,8 @@ You can use the REPL environment to help you understand your context, especially
 - **Headers:** `re.findall(r'^#{1,3} (.+)$', text, re.MULTILINE)` - find all section titles
 - **Split by sections:** `re.split(r'^## ', text, flags=re.MULTILINE)` - chunk by h2 headers
 - **Find keywords:** `re.findall(r'(?i)(keyword1|keyword2)', text)` - case-insensitive search
-- **Extract sections:** `re.search(r'## Section Title(.+?)(?=^##|\Z)', text, re.DOTALL|re.MULTILINE)` - get specific section
-- **Numbers/values:** `re.findall(r'\d+\.?\d*\s*(?:g/dL|mg|%)', text)` - extract measurements
+- **Extract sections:** `re.search(r'## Section Title(.+?)(?=^##|\\Z)', text, re.DOTALL|re.MULTILINE)` - get specific section
+- **Numbers/values:** `re.findall(r'\\d+\\.?\\d*\\s*(?:g/dL|mg|%)', text)` - extract measurements
 
 **Markdown chunking strategy:** For 500K+ char files, use `re.split(r'^## ', text, flags=re.MULTILINE)` to split by H2 headers, group small sections together to make ~150K char chunks, then process with `llm_query_batched`.
 
@@ -82,18 +82,18 @@ results = []
 for key, file_content in context.items():
     if key == 'user_task':
         continue
-    
+
     print(f"File: {{key}}, Size: {{len(file_content):,}} chars")
-    
+
     # Explore with regex - find relevant sections in markdown
     headers = re.findall(r'^## (.+)$', file_content, re.MULTILINE)
     print(f"  Found {{len(headers)}} H2 sections")
-    
+
     # Search for query-relevant keywords
     keywords = re.findall(r'(?i)(hemoglobin|HB level|anemia)', file_content)
     if keywords:
         print(f"  ✓ Found {{len(keywords)}} keyword matches - relevant!")
-    
+
     # Smart chunking: split by H2 headers, group into ~150K char chunks
     if len(file_content) > 150000:
         sections = re.split(r'(^## .+$)', file_content, flags=re.MULTILINE)
@@ -108,7 +108,7 @@ for key, file_content in context.items():
                 current_chunk += section
         if current_chunk:
             chunks.append(current_chunk)
-        
+
         print(f"  Split into {{len(chunks)}} semantic chunks")
         chunk_results = llm_query_batched([f"Extract info about: {{query}}\\n\\n{{chunk}}" for chunk in chunks])
         result = llm_query(f"Combine:\\n" + "\\n".join(chunk_results))
@@ -158,7 +158,15 @@ GOOD Examples:
 
 Think step by step carefully, plan, and execute this plan immediately in your response -- do not just say "I will do this" or "I will do that". Output to the REPL environment and recursive LLMs as much as possible. Remember to explicitly answer the original query in your final answer.
 """
-)
+
+
+def _fmt_size(length: int) -> str:
+    """Format a character count for readability, e.g. 1.5K chars."""
+    if length > 1_000_000:
+        return f"{length/1_000_000:.1f}M chars"
+    if length > 1_000:
+        return f"{length/1_000:.1f}K chars"
+    return f"{length} chars"
 
 
 def build_rlm_system_prompt(
@@ -180,29 +188,21 @@ def build_rlm_system_prompt(
     context_type = query_metadata.context_type
     context_keys = query_metadata.context_keys
 
-    # Build metadata message
-    metadata_prompt = f"Your context is a {context_type} with {context_total_length:,} total characters."
-    
+    # Build metadata message; pieces are collected and joined once
+    parts = [f"Your context is a {context_type} with {context_total_length:,} total characters."]
+
     # Add file information for dict context
     if context_type == "dict" and context_keys:
-        metadata_prompt += "\n\n**Files in context:**"
+        parts.append("\n\n**Files in context:**")
         for i, (key, length) in enumerate(zip(context_keys, context_lengths)):
             if i >= 50:  # Limit display to first 50 files
-                metadata_prompt += f"\n... and {len(context_keys) - 50} more files"
+                parts.append(f"\n... and {len(context_keys) - 50} more files")
                 break
-            # Format file size for readability
-            if length > 1_000_000:
-                size_str = f"{length/1_000_000:.1f}M chars"
-            elif length > 1_000:
-                size_str = f"{length/1_000:.1f}K chars"
-            else:
-                size_str = f"{length} chars"
-            
             # Shorten long file paths for display
             display_key = key if len(key) < 80 else "..." + key[-77:]
-            metadata_prompt += f"\n- `{display_key}` ({size_str})"
-        
-        metadata_prompt += "\n\n**Important:** Files larger than 150K characters must be chunked before sending to sub-LLMs (50K token limit). Use regex (`re` module) to explore large files first. Access files via `context[key]` where key is the file path."
+            parts.append(f"\n- `{display_key}` ({_fmt_size(length)})")
+
+        parts.append("\n\n**Important:** Files larger than 150K characters must be chunked before sending to sub-LLMs (50K token limit). Use regex (`re` module) to explore large files first. Access files via `context[key]` where key is the file path.")
     else:
         # For non-dict contexts, show chunk sizes
         if len(context_lengths) > 100:
@@ -210,7 +210,9 @@ def build_rlm_system_prompt(
             context_lengths_str = str(context_lengths[:100]) + f"... [{others} others]"
         else:
             context_lengths_str = str(context_lengths)
-        metadata_prompt += f" Chunk lengths: {context_lengths_str}"
+        parts.append(f" Chunk lengths: {context_lengths_str}")
+
+    metadata_prompt = "".join(parts)
 
     return [
         {"role": "system", "content": system_prompt},
@@ -222,15 +224,17 @@ USER_PROMPT = """Think step-by-step on what to do using the REPL environment (wh
 USER_PROMPT_WITH_ROOT = """Think step-by-step on what to do using the REPL environment (which contains the context) to answer the original prompt: \"{root_prompt}\".\n\nContinue using the REPL environment, which has the `context` variable, and querying sub-LLMs by writing to ```repl``` tags, and determine your answer. Your next action:"""
 
 
-def build_user_prompt(root_prompt: str | None = None, iteration: int = 0) -> dict[str, str]:
-    if iteration == 0:
-        safeguard = "You have not interacted with the REPL environment or seen your prompt / context yet. Your next action should be to look through and figure out how to answer the prompt, so don't just provide a final answer yet.\n\n"
-        prompt = safeguard + (
-            USER_PROMPT_WITH_ROOT.format(root_prompt=root_prompt) if root_prompt else USER_PROMPT
-        )
-        return {"role": "user", "content": prompt}
+@lru_cache(maxsize=256)
+def _format_user_prompt(root_prompt: str | None, first: bool) -> str:
+    """User prompt text; identical for every iteration after the first, so format it once."""
+    if first:
+        prefix = "You have not interacted with the REPL environment or seen your prompt / context yet. Your next action should be to look through and figure out how to answer the prompt, so don't just provide a final answer yet.\n\n"
     else:
-        prompt = "The history before is your previous interactions with the REPL environment. " + (
-            USER_PROMPT_WITH_ROOT.format(root_prompt=root_prompt) if root_prompt else USER_PROMPT
-        )
-        return {"role": "user", "content": prompt}
+        prefix = "The history before is your previous interactions with the REPL environment. "
+    return prefix + (
+        USER_PROMPT_WITH_ROOT.format(root_prompt=root_prompt) if root_prompt else USER_PROMPT
+    )
+
+
+def build_user_prompt(root_prompt: str | None = None, iteration: int = 0) -> dict[str, str]:
+    return {"role": "user", "content": _format_user_prompt(root_prompt, iteration == 0)}
@@ -9,19 +9,48 @@ This tests:
 4. No hangs during cleanup
 """
 
+import multiprocessing
 import os
 import sys
 import time
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 
+import openai
+from dotenv import load_dotenv
 
-def init_worker():
+from rlm import RLM
+
+load_dotenv()
+
+# Resolved once in the parent and handed to workers via initargs
+API_KEY = os.getenv("OPENROUTER_API_KEY") or os.getenv("OPENAI_API_KEY")
+BASE_URL = "https://openrouter.ai/api/v1" if os.getenv("OPENROUTER_API_KEY") else None
+
+# On Linux, fork so workers inherit the already-imported rlm/openai modules copy-on-write;
+# elsewhere keep the platform default (spawn), which re-imports them per worker.
+MP_CONTEXT = multiprocessing.get_context("fork") if sys.platform == "linux" else None
+
+
+@dataclass(slots=True)
+class TaskResult:
+    """Outcome of one RLM task, pickled back from the worker."""
+
+    example_id: str
+    time: float
+    success: bool
+    answer: str | None = None
+    llm_calls: int = 0
+    error: str | None = None
+
+
+# Built once per worker by init_worker and reused for every task that worker runs
+rlm_client = None
+
+
+def init_worker(api_key: str | None, base_url: str | None):
     """Initialize RLM once per worker process."""
     global rlm_client
-    from rlm import RLM
-
-    api_key = os.getenv("OPENROUTER_API_KEY") or os.getenv("OPENAI_API_KEY")
-    base_url = "https://openrouter.ai/api/v1" if os.getenv("OPENROUTER_API_KEY") else None
 
     print(f"[Worker {os.getpid()}] Initializing RLM...", file=sys.stderr)
     rlm_client = RLM(
@@ -30,6 +59,8 @@ def init_worker():
             "model_name": "openai/gpt-4o-mini",
             "api_key": api_key,
             "base_url": base_url,
+            # Built after fork and reused by every call this worker makes
+            "http_client": openai.DefaultHttpxClient(),
         },
         environment="local",
         verbose=False,
@@ -37,9 +68,11 @@ def init_worker():
     print(f"[Worker {os.getpid()}] RLM initialized", file=sys.stderr)
 
 
-def run_rlm_task(example_id: str, question: str, context: str) -> dict:
+def run_rlm_task(example_id: str, question: str, context: str) -> TaskResult:
     """Run a single RLM call in the worker process."""
-    global rlm_client
+    if rlm_client is None:
+        # The pool initializer did not run in this process; build the client once now
+        init_worker(API_KEY, BASE_URL)
 
     start_time = time.time()
     print(f"[Worker {os.getpid()}] Running task {example_id}...", file=sys.stderr)
@@ -52,24 +85,17 @@ def run_rlm_task(example_id: str, question: str, context: str) -> dict:
         elapsed = time.time() - start_time
         print(f"[Worker {os.getpid()}] Task {example_id} done ({elapsed:.1f}s)", file=sys.stderr)
 
-        return {
-            "example_id": example_id,
-            "answer": result.response[:50] + "..."
-            if len(result.response) > 50
-            else result.response,
-            "time": elapsed,
-            "llm_calls": total_calls,
-            "success": True,
-        }
+        return TaskResult(
+            example_id=example_id,
+            time=elapsed,
+            success=True,
+            answer=result.response[:50] + "..." if len(result.response) > 50 else result.response,
+            llm_calls=total_calls,
+        )
     except Exception as e:
         elapsed = time.time() - start_time
         print(f"[Worker {os.getpid()}] Task {example_id} ERROR: {e}", file=sys.stderr)
-        return {
-            "example_id": example_id,
-            "error": str(e),
-            "time": elapsed,
-            "success": False,
-        }
+        return TaskResult(example_id=example_id, time=elapsed, success=False, error=str(e))
 
 
 def test_multiprocessing_rlm():
@@ -114,7 +140,11 @@ def test_multiprocessing_rlm():
         # Use 2 workers for RLM
         with ProcessPoolExecutor(
             max_workers=2,
+            mp_context=MP_CONTEXT,
             initializer=init_worker,
+            initargs=(API_KEY, BASE_URL),
+            # Never recycle workers: each one keeps its warm RLM client for all tasks
+            max_tasks_per_child=None,
         ) as executor:
             # Submit all tasks
             future_to_task = {
@@ -127,12 +157,12 @@ def test_multiprocessing_rlm():
                 try:
                     result = future.result()
                     results.append(result)
-                    if result["success"]:
+                    if result.success:
                         print(
-                            f"✓ {result['example_id']}: {result['time']:.1f}s, {result['llm_calls']} calls"
+                            f"✓ {result.example_id}: {result.time:.1f}s, {result.llm_calls} calls"
                         )
                     else:
-                        print(f"✗ {result['example_id']}: {result['error']}")
+                        print(f"✗ {result.example_id}: {result.error}")
                         errors.append(result)
                 except Exception as e:
                     print(f"✗ Task failed with exception: {e}")
@@ -145,11 +175,11 @@ def test_multiprocessing_rlm():
         print("RESULTS")
         print("=" * 70)
         print(f"Total time: {elapsed_total:.1f}s")
-        print(f"Successful: {len([r for r in results if r.get('success')])}/{len(test_tasks)}")
+        print(f"Successful: {sum(r.success for r in results)}/{len(test_tasks)}")
         print(f"Failed: {len(errors)}")
 
         if results:
-            avg_time = sum(r["time"] for r in results) / len(results)
+            avg_time = sum(r.time for r in results) / len(results)
             print(f"Avg time per task: {avg_time:.1f}s")
 
         if errors:
@@ -171,5 +201,10 @@ def test_multiprocessing_rlm():
 
 
 if __name__ == "__main__":
+    # Fail before any worker is started, rather than once per worker on its first call
+    if not API_KEY:
+        print("Error: OPENROUTER_API_KEY (or OPENAI_API_KEY) not found in environment.")
+        print("Set it in .env file to run this test.")
+        sys.exit(1)
     success = test_multiprocessing_rlm()
     sys.exit(0 if success else 1)
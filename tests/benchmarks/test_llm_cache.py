@@ -0,0 +1,95 @@
+"""Tests for the benchmark completion cache and its keys."""
+
+from benchmarks import runner
+from benchmarks.config import BenchmarkConfig, ModelConfig
+from benchmarks.llm_cache import LLMCache
+
+QUESTION = "Who wrote it?"
+CONTEXT = "It was written by Ada."
+
+
+def _direct_key(bench_runner, model_config, template=runner.DIRECT_PROMPT_TEMPLATE) -> str:
+    """Build a direct-call key the way the runner does."""
+    return LLMCache.make_key(
+        bench_runner._call_config(model_config), template % (CONTEXT, QUESTION)
+    )
+
+
+def _runner(base_url: str | None = None) -> runner.BenchmarkRunner:
+    model = ModelConfig("Base", "openai/gpt-4o", "openrouter", use_rlm=False)
+    bench_runner = runner.BenchmarkRunner(BenchmarkConfig(models=[model]))
+    bench_runner._base_url = base_url
+    return bench_runner
+
+
+class TestMakeKey:
+    """Every setting that can change the answer must change the key."""
+
+    def test_same_config_and_inputs_give_same_key(self):
+        model = ModelConfig("Base", "openai/gpt-4o", "openrouter", use_rlm=False)
+        assert _direct_key(_runner(), model) == _direct_key(_runner(), model)
+
+    def test_model_changes_key(self):
+        a = ModelConfig("Base", "openai/gpt-4o", "openrouter", use_rlm=False)
+        b = ModelConfig("Base", "openai/gpt-4o-mini", "openrouter", use_rlm=False)
+        assert _direct_key(_runner(), a) != _direct_key(_runner(), b)
+
+    def test_temperature_changes_key(self, monkeypatch):
+        model = ModelConfig("Base", "openai/gpt-4o", "openrouter", use_rlm=False)
+        greedy = _direct_key(_runner(), model)
+        monkeypatch.setattr(runner, "DIRECT_TEMPERATURE", 0.7)
+        assert _direct_key(_runner(), model) != greedy
+
+    def test_base_url_changes_key(self):
+        model = ModelConfig("Base", "openai/gpt-4o", "openrouter", use_rlm=False)
+        openrouter = _direct_key(_runner("https://openrouter.ai/api/v1"), model)
+        assert _direct_key(_runner(None), model) != openrouter
+
+    def test_prompt_template_changes_key(self):
+        model = ModelConfig("Base", "openai/gpt-4o", "openrouter", use_rlm=False)
+        other_template = "Question: %s\n\nContext:\n%s"
+        assert _direct_key(_runner(), model) != _direct_key(_runner(), model, other_template)
+
+    def test_rlm_and_direct_keys_differ(self):
+        bench_runner = _runner()
+        direct = ModelConfig("Base", "openai/gpt-4o", "openrouter", use_rlm=False)
+        rlm = ModelConfig("Base", "openai/gpt-4o", "openrouter", use_rlm=True)
+        assert LLMCache.make_key(
+            bench_runner._call_config(direct), QUESTION, CONTEXT
+        ) != LLMCache.make_key(bench_runner._call_config(rlm), QUESTION, CONTEXT)
+
+    def test_input_boundaries_are_not_ambiguous(self):
+        assert LLMCache.make_key({}, "ab", "c") != LLMCache.make_key({}, "a", "bc")
+
+
+class TestLLMCache:
+    """Storage behaviour of LLMCache."""
+
+    def test_reopened_cache_returns_stored_result(self, tmp_path):
+        path = str(tmp_path / "cache")
+        result = {"answer": "Ada", "time": 1.5, "llm_calls": 1}
+        cache = LLMCache(path)
+        cache.put("k", result)
+        cache.close()
+
+        cache = LLMCache(path)
+        assert cache.get("k") == {**result, "cached": True}
+        assert cache.get("missing") is None
+        cache.close()
+
+    def test_error_results_are_never_stored(self, tmp_path):
+        path = str(tmp_path / "cache")
+        cache = LLMCache(path)
+        cache.put("k", {"answer": "Error: boom", "time": 0, "error": "boom", "llm_calls": 0})
+        cache.close()
+
+        cache = LLMCache(path)
+        assert cache.get("k") is None
+        cache.close()
+
+    def test_disabled_cache_stores_nothing(self, tmp_path):
+        cache = LLMCache(str(tmp_path / "cache"), enabled=False)
+        cache.put("k", {"answer": "Ada"})
+        assert cache.get("k") is None
+        assert list(tmp_path.iterdir()) == []
+        cache.close()
@@ -0,0 +1,133 @@
+"""Tests for the client-side TokenBucket rate limiter."""
+
+import asyncio
+import types
+
+import pytest
+
+from benchmarks import rate_limiter, runner
+from benchmarks.config import BenchmarkConfig, ModelConfig
+from benchmarks.rate_limiter import TokenBucket
+from benchmarks.tasks.base_task import BenchmarkExample
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the limiter sleeps (or the test advances it)."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", types.SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(
+        rate_limiter, "asyncio", types.SimpleNamespace(Lock=asyncio.Lock, sleep=clock.sleep)
+    )
+    return clock
+
+
+def _acquire(bucket: TokenBucket, times: int = 1):
+    async def acquire_all():
+        for _ in range(times):
+            await bucket.acquire()
+
+    asyncio.run(acquire_all())
+
+
+class TestTokenBucket:
+    def test_full_bucket_admits_a_minute_of_requests_then_waits(self, clock):
+        bucket = TokenBucket(rpm=60)
+        _acquire(bucket, 60)
+        assert clock.sleeps == []
+        _acquire(bucket)
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    def test_bucket_refills_with_elapsed_time(self, clock):
+        bucket = TokenBucket(rpm=60)
+        _acquire(bucket, 60)
+        clock.now += 30
+        _acquire(bucket, 30)
+        assert clock.sleeps == []
+        # Refill is capped at one minute's budget
+        clock.now += 3600
+        _acquire(bucket, 60)
+        assert clock.sleeps == []
+        _acquire(bucket)
+        assert len(clock.sleeps) == 1
+
+    def test_request_larger_than_capacity_waits_a_finite_time(self, clock):
+        bucket = TokenBucket(tpm=100)
+        _acquire(bucket)
+        bucket.record_tokens(250)  # one response used 2.5x the per-minute budget
+        _acquire(bucket)
+        # Debt of 150 tokens at 100 tokens/minute
+        assert clock.sleeps == [pytest.approx(90.0)]
+
+    def test_tokens_are_charged_after_the_response(self, clock):
+        bucket = TokenBucket(tpm=1000)
+        bucket.record_tokens(400)
+        bucket.record_tokens(400)
+        _acquire(bucket)
+        assert clock.sleeps == []
+        bucket.record_tokens(400)
+        _acquire(bucket)
+        # 200 tokens in debt at 1000 tokens/minute
+        assert clock.sleeps == [pytest.approx(12.0)]
+
+    def test_rpm_only_bucket_ignores_tokens(self, clock):
+        bucket = TokenBucket(rpm=10)
+        bucket.record_tokens(10**9)
+        _acquire(bucket)
+        assert clock.sleeps == []
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rpm=0)
+        with pytest.raises(ValueError):
+            TokenBucket(tpm=0)
+
+
+def test_runner_charges_provider_reported_usage(tmp_path, monkeypatch, clock):
+    class FakeTask:
+        dataset_name = "fake"
+
+        def get_examples(self):
+            return [
+                BenchmarkExample(id=str(i), question="q", context="c", gold_answer="a")
+                for i in range(3)
+            ]
+
+    class FakeClient:
+        async def close(self):
+            pass
+
+    async def fake_call(self, client, model_id, prompt):
+        usage = {"total_calls": 1, "total_input_tokens": 30, "total_output_tokens": 20}
+        return {
+            "answer": "a",
+            "time": 0.1,
+            "model": model_id,
+            "llm_calls": 1,
+            "usage": {"model_usage_summaries": {model_id: usage}},
+        }
+
+    monkeypatch.setattr(runner.BenchmarkRunner, "_run_openai_call", fake_call)
+    monkeypatch.setattr(runner.BenchmarkRunner, "_create_openai_client", lambda self: FakeClient())
+    model = ModelConfig("Base", "m/base", "openrouter", use_rlm=False, tpm=1000)
+    bench_runner = runner.BenchmarkRunner(BenchmarkConfig(models=[model], output_dir=str(tmp_path)))
+    bench_runner.tasks = [FakeTask()]
+    bench_runner.run()
+
+    # Three responses of 50 tokens each; the frozen clock means nothing refills
+    assert bench_runner._rate_limiters["Base"]._tokens == 1000 - 150
+    assert clock.sleeps == []
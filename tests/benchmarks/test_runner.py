@@ -0,0 +1,122 @@
+"""Tests for BenchmarkRunner result recording and summaries."""
+
+import asyncio
+import json
+import os
+import time
+from types import SimpleNamespace
+
+from benchmarks import runner
+from benchmarks.config import BenchmarkConfig, ModelConfig
+from benchmarks.llm_cache import LLMCache
+from benchmarks.tasks.base_task import BaseTask, BenchmarkExample
+
+EXAMPLES = [
+    BenchmarkExample(id=str(i), question=f"q{i}", context=f"c{i}", gold_answer="yes")
+    for i in range(2)
+]
+
+
+class FakeTask:
+    dataset_name = "fake"
+
+    def get_examples(self):
+        return EXAMPLES
+
+
+class FakeClient:
+    async def close(self):
+        pass
+
+
+async def _fake_call(self, client, model_id, prompt):
+    return {"answer": "yes", "time": 2.0, "model": model_id, "llm_calls": 1}
+
+
+def _direct_key(bench_runner, model_config, example) -> str:
+    prompt = runner.DIRECT_PROMPT_TEMPLATE % (example.context, example.question)
+    return LLMCache.make_key(bench_runner._call_config(model_config), prompt)
+
+
+def test_cached_results_are_counted_and_left_out_of_avg_time(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(runner.BenchmarkRunner, "_run_openai_call", _fake_call)
+    monkeypatch.setattr(runner.BenchmarkRunner, "_create_openai_client", lambda self: FakeClient())
+    partly_cached = ModelConfig("Partly", "m/partly", "openrouter", use_rlm=False)
+    all_cached = ModelConfig("All", "m/all", "openrouter", use_rlm=False)
+    config = BenchmarkConfig(
+        models=[partly_cached, all_cached], output_dir=str(tmp_path), use_cache=True
+    )
+    bench_runner = runner.BenchmarkRunner(config)
+    bench_runner.tasks = [FakeTask()]
+
+    # Cached entries carry the original call's time, which must not reach the average
+    cached_result = {"answer": "yes", "time": 100.0, "llm_calls": 1}
+    cache = LLMCache(os.path.join(str(tmp_path), ".llm_cache"))
+    cache.put(_direct_key(bench_runner, partly_cached, EXAMPLES[0]), cached_result)
+    for example in EXAMPLES:
+        cache.put(_direct_key(bench_runner, all_cached, example), cached_result)
+    cache.close()
+
+    bench_runner.run()
+
+    summary = {
+        line.split()[0]: line for line in capsys.readouterr().out.splitlines() if "| F1:" in line
+    }
+    assert "Time:   2.0s" in summary["Partly"]
+    assert "Cached: 1/2" in summary["Partly"]
+    assert "Time:    n/a" in summary["All"]
+    assert "Cached: 2/2" in summary["All"]
+
+    output_file = bench_runner._output_template.format(task_name="fake")
+    with open(output_file) as f:
+        entries = [json.loads(line) for line in f]
+    # Entries are written in completion order
+    cached_by_id = {e["id"]: e["models"]["Partly"].get("cached") for e in entries}
+    assert cached_by_id == {"0": True, "1": None}
+    assert all(e["models"]["All"]["cached"] for e in entries)
+
+
+def test_empty_reply_is_an_empty_answer():
+    async def create(**kwargs):
+        message = SimpleNamespace(content=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    bench_runner = runner.BenchmarkRunner(BenchmarkConfig(models=[]))
+    result = asyncio.run(bench_runner._run_openai_call(client, "m/base", "prompt"))
+    assert result["answer"] == ""
+    assert "error" not in result
+
+
+class SlowTask(BaseTask):
+    """Task whose load logs two lines with a pause between them."""
+
+    def __init__(self, max_samples: int, name: str, delay: float):
+        super().__init__(name, max_samples=max_samples)
+        self.delay = delay
+
+    def load(self):
+        self.log(f"Loading {self.dataset_name}...")
+        time.sleep(self.delay)
+        self.examples = EXAMPLES
+        self.log(f"Loaded {self.dataset_name}.")
+
+
+def test_load_tasks_prints_each_task_in_order(monkeypatch, capsys):
+    monkeypatch.setitem(
+        runner._TASK_REGISTRY, "slow", (__name__, "SlowTask", {"name": "slow", "delay": 0.05})
+    )
+    monkeypatch.setitem(
+        runner._TASK_REGISTRY, "fast", (__name__, "SlowTask", {"name": "fast", "delay": 0.0})
+    )
+    bench_runner = runner.BenchmarkRunner(BenchmarkConfig(models=[]))
+    bench_runner.load_tasks(["slow", "fast"])
+
+    assert capsys.readouterr().out.splitlines() == [
+        "Loading datasets: slow, fast...",
+        "Loading slow...",
+        "Loaded slow.",
+        "Loading fast...",
+        "Loaded fast.",
+    ]
+    assert [task.examples for task in bench_runner.tasks] == [EXAMPLES, EXAMPLES]
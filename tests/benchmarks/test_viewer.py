@@ -0,0 +1,39 @@
+"""Tests for reading benchmark results in the viewer."""
+
+from benchmarks.viewer import (
+    aggregate_metrics,
+    compute_costs,
+    generate_markdown_report,
+    iter_results,
+)
+
+
+def test_iter_results_skips_blank_and_whitespace_lines(tmp_path):
+    path = tmp_path / "run_results_20260101_000000.jsonl"
+    path.write_bytes(b'{"id": "1"}\n\n  \n\r\n{"id": "2"}\r\n\t\n{"id": "3"}')
+    assert [r["id"] for r in iter_results(str(path))] == ["1", "2", "3"]
+
+
+def _result(example_id: str) -> dict:
+    model = {"answer": "a", "f1": 1.0, "em": True, "time": 1.0, "llm_calls": 1, "model": "m"}
+    return {"id": example_id, "question": "q", "gold_answer": "a", "models": {"Base": model}}
+
+
+def test_generate_markdown_report_computes_missing_aggregates(tmp_path):
+    results = [_result("1"), _result("2")]
+    model_names = ["Base"]
+    costs = compute_costs(results, model_names)
+    _, metrics = aggregate_metrics(zip(results, costs, strict=True), model_names)
+
+    (tmp_path / "full").mkdir()
+    (tmp_path / "short").mkdir()
+    full = generate_markdown_report(
+        results, "r", str(tmp_path / "full"), model_names, metrics, costs
+    )
+    short = generate_markdown_report(results, "r", str(tmp_path / "short"))
+
+    def body(path):
+        with open(path) as f:
+            return [line for line in f if not line.startswith("**Generated:**")]
+
+    assert body(short) == body(full)
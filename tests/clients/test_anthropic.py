@@ -0,0 +1,77 @@
+"""Tests for AnthropicClient request payloads and usage accounting."""
+
+from unittest.mock import MagicMock
+
+from anthropic.types import Message, TextBlock, Usage
+
+from rlm.clients.anthropic import AnthropicClient
+
+PROMPT = [
+    {"role": "system", "content": "You are an RLM."},
+    {"role": "user", "content": "hi"},
+]
+
+
+def _message(**usage) -> Message:
+    return Message(
+        id="msg_test",
+        type="message",
+        role="assistant",
+        model="claude-test",
+        content=[TextBlock(type="text", text="hello")],
+        stop_reason="end_turn",
+        usage=Usage(**usage),
+    )
+
+
+def _client(response: Message, **kwargs) -> AnthropicClient:
+    client = AnthropicClient(api_key="sk-test", model_name="claude-test", **kwargs)
+    client.client.messages.create = MagicMock(return_value=response)
+    return client
+
+
+def test_system_prompt_is_sent_as_plain_string_by_default():
+    client = _client(_message(input_tokens=10, output_tokens=2))
+    assert client.completion(PROMPT) == "hello"
+    kwargs = client.client.messages.create.call_args.kwargs
+    assert kwargs["system"] == "You are an RLM."
+    assert kwargs["messages"] == [{"role": "user", "content": "hi"}]
+
+
+def test_cache_system_prompt_marks_system_block_ephemeral():
+    client = _client(_message(input_tokens=10, output_tokens=2), cache_system_prompt=True)
+    client.completion(PROMPT)
+    assert client.client.messages.create.call_args.kwargs["system"] == [
+        {"type": "text", "text": "You are an RLM.", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert "cache_system_prompt" not in client.kwargs
+
+
+def test_cache_tokens_are_tracked_separately_from_input_tokens():
+    client = _client(
+        _message(
+            input_tokens=10,
+            output_tokens=2,
+            cache_creation_input_tokens=300,
+            cache_read_input_tokens=500,
+        ),
+        cache_system_prompt=True,
+    )
+    client.completion(PROMPT)
+    client.completion(PROMPT)
+
+    assert client.model_input_tokens["claude-test"] == 20
+    assert client.model_total_tokens["claude-test"] == 24
+    assert client.model_cache_write_tokens["claude-test"] == 600
+    assert client.model_cache_read_tokens["claude-test"] == 1000
+    last = client.get_last_usage()
+    assert (last.total_input_tokens, last.total_output_tokens) == (10, 2)
+    summary = client.get_usage_summary().model_usage_summaries["claude-test"]
+    assert (summary.total_calls, summary.total_input_tokens) == (2, 20)
+
+
+def test_missing_cache_usage_counts_as_zero():
+    client = _client(_message(input_tokens=7, output_tokens=1))
+    client.completion(PROMPT)
+    assert client.model_cache_write_tokens["claude-test"] == 0
+    assert client.model_cache_read_tokens["claude-test"] == 0
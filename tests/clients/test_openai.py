@@ -0,0 +1,15 @@
+"""Tests for OpenAIClient construction."""
+
+import openai
+
+from rlm.clients.openai import OpenAIClient
+
+
+def test_shared_http_client_is_used_and_not_sent_as_completion_kwarg():
+    http_client = openai.DefaultHttpxClient()
+    a = OpenAIClient(api_key="sk-test", model_name="m", http_client=http_client)
+    b = OpenAIClient(api_key="sk-test", model_name="m", http_client=http_client)
+    assert a.client._client is http_client
+    assert b.client._client is http_client
+    assert "http_client" not in a.kwargs
+    http_client.close()
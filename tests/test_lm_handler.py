@@ -0,0 +1,55 @@
+"""Tests for LMHandler request routing."""
+
+import asyncio
+
+import pytest
+
+from rlm.core.comms_utils import send_lm_request_batched
+from rlm.core.lm_handler import LMHandler
+from rlm.core.rlm import RLM
+from tests.mock_lm import MockLM
+
+
+class SlowAsyncMockLM(MockLM):
+    """Mock LM whose async calls take a moment, recording peak concurrency."""
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def acompletion(self, prompt):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.completion(prompt)
+
+
+class TestBatchedRequests:
+    """Tests for llm_query_batched handling."""
+
+    def test_batched_responses_keep_order(self):
+        with LMHandler(MockLM()) as handler:
+            prompts = [f"prompt {i}" for i in range(5)]
+            responses = send_lm_request_batched(handler.address, prompts)
+        assert all(r.success for r in responses)
+        assert [r.chat_completion.prompt for r in responses] == prompts
+
+    def test_batched_concurrency_is_bounded(self):
+        client = SlowAsyncMockLM()
+        with LMHandler(client, max_batch_concurrency=3) as handler:
+            responses = send_lm_request_batched(handler.address, [f"p{i}" for i in range(10)])
+        assert all(r.success for r in responses)
+        assert client.peak_in_flight == 3
+
+    def test_invalid_max_batch_concurrency(self):
+        with pytest.raises(ValueError):
+            LMHandler(MockLM(), max_batch_concurrency=0)
+
+    def test_rlm_passes_max_batch_concurrency_to_handler(self, monkeypatch):
+        # Patch through the function globals: test_imports re-imports rlm modules
+        monkeypatch.setitem(RLM.completion.__globals__, "get_client", lambda *_: MockLM())
+        rlm = RLM(max_batch_concurrency=4)
+        with rlm._spawn_completion_context("context") as (lm_handler, _):
+            assert lm_handler.max_batch_concurrency == 4
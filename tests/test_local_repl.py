@@ -193,3 +193,17 @@ class TestLocalREPLCleanup:
         assert os.path.exists(temp_dir)
         repl.cleanup()
         assert not os.path.exists(temp_dir)
+
+
+class TestLocalREPLOutputCapture:
+    """Tests for bounded stdout capture."""
+
+    def test_runaway_output_is_capped_and_execution_continues(self, monkeypatch):
+        # Patch the globals LocalREPL actually uses; test_imports re-imports the module
+        monkeypatch.setitem(LocalREPL.execute_code.__globals__, "MAX_CAPTURED_OUTPUT_CHARS", 100)
+        repl = LocalREPL()
+        result = repl.execute_code("for i in range(100):\n    print('x' * 9)\ndone = True")
+        assert result.stdout.startswith("x" * 9 + "\n")
+        assert result.stdout.endswith("... + [900 chars dropped from captured output]")
+        assert repl.locals["done"] is True
+        repl.cleanup()
@@ -0,0 +1,55 @@
+"""Tests for prompt building utilities."""
+
+from rlm.core.types import QueryMetadata
+from rlm.utils.prompts import build_rlm_system_prompt, build_user_prompt
+
+
+class TestBuildRLMSystemPrompt:
+    """Tests for build_rlm_system_prompt function."""
+
+    def test_string_context(self):
+        messages = build_rlm_system_prompt("SYSTEM", QueryMetadata("hello"))
+        assert messages[0] == {"role": "system", "content": "SYSTEM"}
+        assert messages[1]["role"] == "assistant"
+        assert messages[1]["content"] == (
+            "Your context is a str with 5 total characters. Chunk lengths: [5]"
+        )
+
+    def test_dict_context_lists_files_with_sizes(self):
+        context = {"small.txt": "x" * 10, "medium.md": "y" * 1500, "large.json": "z" * 2_500_000}
+        content = build_rlm_system_prompt("SYSTEM", QueryMetadata(context))[1]["content"]
+        assert "**Files in context:**" in content
+        assert "- `small.txt` (10 chars)" in content
+        assert "- `medium.md` (1.5K chars)" in content
+        assert "- `large.json` (2.5M chars)" in content
+        assert content.endswith("where key is the file path.")
+
+    def test_dict_context_caps_file_list(self):
+        context = {f"file_{i}.txt": "x" for i in range(55)}
+        content = build_rlm_system_prompt("SYSTEM", QueryMetadata(context))[1]["content"]
+        assert "- `file_49.txt` (1 chars)" in content
+        assert "file_50.txt" not in content
+        assert "... and 5 more files" in content
+
+
+class TestBuildUserPrompt:
+    """Tests for build_user_prompt function."""
+
+    def test_first_and_later_iterations(self):
+        first = build_user_prompt("What is 2+2?", 0)
+        later = build_user_prompt("What is 2+2?", 3)
+        assert first["role"] == later["role"] == "user"
+        assert first["content"].startswith("You have not interacted with the REPL")
+        assert later["content"].startswith("The history before is your previous interactions")
+        assert 'answer the original prompt: "What is 2+2?"' in later["content"]
+        assert build_user_prompt("What is 2+2?", 7) == later
+
+    def test_without_root_prompt(self):
+        content = build_user_prompt(None, 1)["content"]
+        assert "original prompt" not in content
+        assert content.endswith("Your next action:")
+
+    def test_returns_fresh_dict_each_call(self):
+        message = build_user_prompt("q", 1)
+        message["content"] = "mutated"
+        assert build_user_prompt("q", 1)["content"] != "mutated"
@@ -0,0 +1,99 @@
+"""Tests for RLMLogger JSON-lines output."""
+
+import gzip
+import json
+
+import pytest
+
+from rlm.core.rlm import RLM
+from rlm.core.types import CodeBlock, REPLResult, RLMIteration, RLMMetadata
+from rlm.logger import RLMLogger
+from tests.mock_lm import MockLM
+
+
+def _metadata() -> RLMMetadata:
+    return RLMMetadata(
+        root_model="mock-model",
+        max_depth=1,
+        max_iterations=5,
+        backend="openai",
+        backend_kwargs={"model_name": "mock-model"},
+        environment_type="local",
+        environment_kwargs={},
+    )
+
+
+def _read_lines(path: str) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestRLMLogger:
+    """Tests for RLMLogger."""
+
+    def test_entries_are_readable_before_close(self, tmp_path):
+        logger = RLMLogger(log_dir=str(tmp_path), file_name="run", flush_every=1)
+        logger.log_metadata(_metadata())
+        logger.log_metadata(_metadata())  # only the first call is written
+        result = REPLResult(stdout="3\n", stderr="", locals={"x": 3})
+        logger.log(
+            RLMIteration(
+                prompt="Calculate 1+2",
+                response="Let me calculate that.",
+                code_blocks=[CodeBlock(code="x = 1 + 2\nprint(x)", result=result)],
+            )
+        )
+        logger.log(RLMIteration(prompt="Done?", response="FINAL(3)", code_blocks=[]))
+
+        entries = _read_lines(logger.log_file_path)
+        logger.close()
+        assert [e["type"] for e in entries] == ["metadata", "iteration", "iteration"]
+        assert entries[0]["root_model"] == "mock-model"
+        assert [e["iteration"] for e in entries[1:]] == [1, 2]
+        assert entries[1]["code_blocks"][0]["result"]["locals"] == {"x": 3}
+        assert logger.iteration_count == 2
+
+    def test_entries_are_flushed_every_n_and_on_close(self, tmp_path):
+        logger = RLMLogger(log_dir=str(tmp_path), flush_every=2)
+        logger.log(RLMIteration(prompt="a", response="b", code_blocks=[]))
+        assert _read_lines(logger.log_file_path) == []
+        logger.log(RLMIteration(prompt="c", response="d", code_blocks=[]))
+        assert len(_read_lines(logger.log_file_path)) == 2
+        logger.log(RLMIteration(prompt="e", response="f", code_blocks=[]))
+        assert len(_read_lines(logger.log_file_path)) == 2
+        logger.close()
+        assert [e["prompt"] for e in _read_lines(logger.log_file_path)] == ["a", "c", "e"]
+
+    def test_invalid_flush_every(self, tmp_path):
+        with pytest.raises(ValueError):
+            RLMLogger(log_dir=str(tmp_path), flush_every=0)
+
+    def test_context_manager_closes_and_log_reopens(self, tmp_path):
+        with RLMLogger(log_dir=str(tmp_path)) as logger:
+            logger.log(RLMIteration(prompt="a", response="b", code_blocks=[]))
+        assert logger._file is None
+
+        logger.log(RLMIteration(prompt="c", response="d", code_blocks=[]))
+        logger.close()
+        assert [e["prompt"] for e in _read_lines(logger.log_file_path)] == ["a", "c"]
+
+    def test_compressed_log(self, tmp_path):
+        with RLMLogger(log_dir=str(tmp_path), compress=True) as logger:
+            logger.log_metadata(_metadata())
+            logger.log(RLMIteration(prompt="a", response="b", code_blocks=[]))
+        assert logger.log_file_path.endswith(".jsonl.gz")
+        with gzip.open(logger.log_file_path, "rt") as f:
+            entries = [json.loads(line) for line in f]
+        assert [e["type"] for e in entries] == ["metadata", "iteration"]
+
+    def test_rlm_closes_logger_after_completion(self, tmp_path, monkeypatch):
+        # Patch through the function globals: test_imports re-imports rlm modules
+        monkeypatch.setitem(RLM.completion.__globals__, "get_client", lambda *_: MockLM())
+        logger = RLMLogger(log_dir=str(tmp_path))
+        rlm = RLM(backend_kwargs={"model_name": "mock-model"}, logger=logger, max_iterations=1)
+        assert logger._file is None
+
+        rlm.completion("What is 1+2?")
+        assert logger._file is None
+        entries = _read_lines(logger.log_file_path)
+        assert [e["type"] for e in entries] == ["metadata", "iteration", "iteration"]
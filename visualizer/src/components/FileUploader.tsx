@@ -14,14 +14,18 @@ export function FileUploader({ onFileLoaded }: FileUploaderProps) {
   const [isLoading, setIsLoading] = useState(false);
 
   const handleFile = useCallback(async (file: File) => {
-    if (!file.name.endsWith('.jsonl')) {
-      alert('Please upload a .jsonl file');
+    const isGzip = file.name.endsWith('.jsonl.gz');
+    if (!file.name.endsWith('.jsonl') && !isGzip) {
+      alert('Please upload a .jsonl or .jsonl.gz file');
       return;
     }
 
     setIsLoading(true);
     try {
-      const content = await file.text();
+      // Logs written with RLMLogger(compress=True) are gzipped; the browser decompresses natively
+      const content = isGzip
+        ? await new Response(file.stream().pipeThrough(new DecompressionStream('gzip'))).text()
+        : await file.text();
       onFileLoaded(file.name, content);
     } catch (error) {
       console.error('Error reading file:', error);
@@ -95,7 +99,7 @@ export function FileUploader({ onFileLoaded }: FileUploaderProps) {
         <input
           type="file"
           id="file-upload"
-          accept=".jsonl"
+          accept=".jsonl,.gz"
           onChange={handleFileSelect}
           className="hidden"
         />